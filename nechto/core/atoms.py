@@ -6,10 +6,11 @@ Canonical data structures: SEMANTIC_ATOM, EDGE, VECTOR.
 
 from __future__ import annotations
 
+import itertools
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import Iterable, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -24,6 +25,34 @@ class NodeStatus(Enum):
     ETHICALLY_BLOCKED = auto()
 
 
+class _StatusField:
+    """
+    Data descriptor behind ``SemanticAtom.status``.  Every write, however
+    it is made, bumps a process-wide epoch so status indexes built over
+    atoms (``SemanticGraph.status_index``) can tell they are stale.
+    """
+
+    epoch = 0
+
+    def __get__(self, obj: object, objtype: type | None = None) -> NodeStatus:
+        if obj is None:
+            # Class access: dataclass reads the field default from here
+            return NodeStatus.FLOATING
+        return obj._status
+
+    def __set__(self, obj: object, value: NodeStatus) -> None:
+        # Modules assign atom.status directly, bypassing the graph; the
+        # epoch bump is how status_index notices those writes.  The value
+        # itself lives under _status because the descriptor owns "status".
+        obj._status = value
+        _StatusField.epoch += 1
+
+
+def status_epoch() -> int:
+    """Counter bumped on every ``SemanticAtom.status`` write."""
+    return _StatusField.epoch
+
+
 # ---------------------------------------------------------------------------
 # Tags
 # ---------------------------------------------------------------------------
@@ -37,6 +66,19 @@ class Tag(Enum):
     BOUNDARY = auto()
 
 
+# One bit per Tag: tag predicates become integer AND tests instead of
+# repeated list scans.
+TAG_BITS: dict[Tag, int] = {t: 1 << i for i, t in enumerate(Tag)}
+
+
+def tag_mask(tags: Iterable[Tag]) -> int:
+    """Bitmask of *tags* (see TAG_BITS)."""
+    m = 0
+    for t in tags:
+        m |= TAG_BITS[t]
+    return m
+
+
 # ---------------------------------------------------------------------------
 # Avoided marker
 # ---------------------------------------------------------------------------
@@ -63,7 +105,7 @@ class SemanticAtom:
 
     label: str
     id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
-    status: NodeStatus = NodeStatus.FLOATING
+    status: NodeStatus = _StatusField()  # default FLOATING
     identity_alignment: float = 0.0          # [-1..1]
     harm_probability: float = 0.0            # [0..1]
     tags: list[Tag] = field(default_factory=list)
@@ -88,6 +130,11 @@ class SemanticAtom:
     _harm_computed: Optional[float] = field(default=None, repr=False)
     _alignment_computed: Optional[float] = field(default=None, repr=False)
 
+    @property
+    def tag_mask(self) -> int:
+        """TAG_BITS mask of the current ``tags`` list (derived on read)."""
+        return tag_mask(self.tags)
+
     def semantic_gravity_vector(self) -> list[float]:
         """Return the 12-D gravity vector for this atom (PART 11.1 A)."""
         return [
@@ -130,11 +177,21 @@ class Edge:
 # ---------------------------------------------------------------------------
 # 3.3 VECTOR (Attention Vector)
 # ---------------------------------------------------------------------------
-@dataclass
+# Vectors are regenerated every cycle and only need to be unique within the
+# process, so a counter replaces uuid4 (urandom read + hex encode).
+_vector_ids = itertools.count()
+
+
+def next_vector_id() -> str:
+    """Return a fresh process-unique 12-char vector id."""
+    return f"v{next(_vector_ids):011x}"
+
+
+@dataclass(slots=True)
 class Vector:
     """Attention trajectory: seed → expansion, evaluated by TSC/SCAV/ETHICS/FLOW."""
 
-    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    id: str = field(default_factory=next_vector_id)
     seed_nodes: list[str] = field(default_factory=list)
     nodes: list[str] = field(default_factory=list)
     edges: list[Edge] = field(default_factory=list)
@@ -154,6 +211,7 @@ class Vector:
     # SCAV 5D raw
     direction_raw: list[float] = field(default_factory=list)
     shadow_raw: list[float] = field(default_factory=list)
+    shadow_magnitude: float = 0.0
     consistency: float = 0.0
     resonance_score: float = 0.0
 
@@ -28,6 +28,24 @@ class Stance(Enum):
     MU = auto()
 
 
+# APPENDIX E rule 2 as a lookup: (observability, stance) pairs that are
+# forbidden.  UNTESTABLE admits only AGNOSTIC or MU.
+_INVALID_PAIRS: frozenset[tuple[Observability, Stance]] = frozenset(
+    (Observability.UNTESTABLE, s)
+    for s in Stance
+    if s not in (Stance.AGNOSTIC, Stance.MU)
+)
+
+
+def invalid_claim_indices(claims) -> list[int]:
+    """Indices of claims whose (observability, stance) pair is forbidden."""
+    invalid = _INVALID_PAIRS
+    return [
+        i for i, c in enumerate(claims)
+        if (c.observability, c.stance) in invalid
+    ]
+
+
 @dataclass
 class EpistemicClaim:
     """
@@ -52,9 +70,7 @@ class EpistemicClaim:
         APPENDIX E rule 2:
         If observability == UNTESTABLE, stance may only be AGNOSTIC or MU.
         """
-        if self.observability == Observability.UNTESTABLE:
-            return self.stance in (Stance.AGNOSTIC, Stance.MU)
-        return True
+        return (self.observability, self.stance) not in _INVALID_PAIRS
 
     def as_dict(self) -> dict:
         return {
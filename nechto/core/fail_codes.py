@@ -62,10 +62,13 @@ FAIL_DESCRIPTIONS: dict[FailCode, dict[str, str]] = {
 }
 
 
+# Name → description, resolved once at import (every FailCode is catalogued)
+_BY_NAME: dict[str, dict[str, str]] = {fc.name: FAIL_DESCRIPTIONS[fc] for fc in FailCode}
+
+
 def get_fail_description(code: str) -> dict[str, str]:
     """Look up a fail code by its string name."""
-    try:
-        fc = FailCode[code]
-        return FAIL_DESCRIPTIONS.get(fc, {"cause": "unknown", "next": "diagnose and propose ONE_STEP"})
-    except KeyError:
+    desc = _BY_NAME.get(code)
+    if desc is None:
         return {"cause": code, "next": "diagnose and propose ONE_STEP"}
+    return desc
@@ -6,44 +6,182 @@ Nodes + edges + evaluation functions.
 
 from __future__ import annotations
 
+import copy
+import itertools
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
-from nechto.core.atoms import SemanticAtom, Edge, EdgeType, NodeStatus, Vector
+from nechto.core.atoms import SemanticAtom, Edge, EdgeType, NodeStatus, Vector, status_epoch
+
+
+# Process-unique graph tokens; unlike id(), never reused after a graph is freed
+_graph_tokens = itertools.count(1)
 
 
 @dataclass
 class SemanticGraph:
-    """Container for semantic atoms and their edges."""
+    """
+    Container for semantic atoms and their edges.
+
+    Mutate ``nodes`` and ``edges`` only through add_node, add_edge,
+    add_edges and remove_node: the derived indexes (out_edges, adjacency,
+    status_index) are keyed to the version those methods bump, so a direct
+    ``graph.edges.append(...)`` or ``graph.nodes[nid] = atom`` leaves them
+    stale.  Status writes may go through ``set_node_status`` or straight to
+    ``atom.status``; both are tracked.
+    """
 
     nodes: dict[str, SemanticAtom] = field(default_factory=dict)
     edges: list[Edge] = field(default_factory=list)
 
+    _token: int = field(
+        default_factory=_graph_tokens.__next__, init=False, repr=False, compare=False,
+    )
+    # Structural mutation counter (nodes/edges added or removed)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # Derived indexes, valid while their stored version == _version
+    _out_index: tuple[int, dict[str, list[Edge]]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _adj_index: tuple[int, dict[str, set[str]]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    # NodeStatus → node ids, valid while its stored (version, status epoch)
+    # match; any atom.status write anywhere bumps the epoch
+    _status_cache: tuple[int, int, defaultdict[NodeStatus, set[str]]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
     # ------------------------------------------------------------------ ops
     def add_node(self, atom: SemanticAtom) -> SemanticAtom:
         self.nodes[atom.id] = atom
+        self._version += 1
         return atom
 
+    def set_node_status(self, node_id: str, status: NodeStatus) -> None:
+        """Change a node's status, moving it between status_index buckets in place."""
+        atom = self.nodes.get(node_id)
+        if atom is None:
+            return
+        cached = self._status_cache
+        fresh = (
+            cached is not None
+            and cached[0] == self._version
+            and cached[1] == status_epoch()
+        )
+        old = atom.status
+        atom.status = status
+        if fresh:
+            index = cached[2]
+            index[old].discard(node_id)
+            index[status].add(node_id)
+            self._status_cache = (self._version, status_epoch(), index)
+
     def add_edge(self, edge: Edge) -> Edge:
         self.edges.append(edge)
+        self._version += 1
         return edge
 
+    def add_edges(self, edges: Iterable[Edge]) -> list[Edge]:
+        """Append a batch of edges with a single version bump."""
+        added = list(edges)
+        if added:
+            self.edges.extend(added)
+            self._version += 1
+        return added
+
     def remove_node(self, node_id: str) -> None:
         self.nodes.pop(node_id, None)
         self.edges = [e for e in self.edges if e.from_id != node_id and e.to_id != node_id]
+        self._version += 1
+
+    @property
+    def token(self) -> int:
+        """Process-unique identity for keying caches across graphs."""
+        return self._token
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every structural mutation."""
+        return self._version
+
+    @property
+    def status_index(self) -> defaultdict[NodeStatus, set[str]]:
+        """
+        {NodeStatus: node ids}, rebuilt lazily after a structural mutation
+        or any status write that did not go through ``set_node_status``
+        (including writes via another graph sharing the atom).  Callers
+        must treat the result as read-only.
+        """
+        cached = self._status_cache
+        epoch = status_epoch()
+        if cached is not None and cached[0] == self._version and cached[1] == epoch:
+            return cached[2]
+        index: defaultdict[NodeStatus, set[str]] = defaultdict(set)
+        for nid, atom in self.nodes.items():
+            index[atom.status].add(nid)
+        self._status_cache = (self._version, epoch, index)
+        return index
 
     def get_node(self, node_id: str) -> Optional[SemanticAtom]:
         return self.nodes.get(node_id)
 
+    def out_edges(self) -> dict[str, list[Edge]]:
+        """
+        Outgoing-edge index {from_id: [edges]}, rebuilt lazily after a
+        structural mutation.  Callers must treat the result as read-only.
+        """
+        cached = self._out_index
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        index: dict[str, list[Edge]] = {}
+        for e in self.edges:
+            index.setdefault(e.from_id, []).append(e)
+        self._out_index = (self._version, index)
+        return index
+
+    def adjacency(self) -> dict[str, set[str]]:
+        """
+        Undirected neighbor sets {node_id: {ids}}, rebuilt lazily after a
+        structural mutation.  Callers must treat the result as read-only.
+        """
+        cached = self._adj_index
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        adj: dict[str, set[str]] = {}
+        for e in self.edges:
+            adj.setdefault(e.from_id, set()).add(e.to_id)
+            adj.setdefault(e.to_id, set()).add(e.from_id)
+        self._adj_index = (self._version, adj)
+        return adj
+
+    def induced_adjacency(self, node_ids: Iterable[str]) -> dict[str, set[str]]:
+        """
+        Undirected neighbor sets of the subgraph induced by *node_ids*.
+        Built from the cached adjacency, so the cost is the induced
+        degrees rather than a scan of every edge.
+        """
+        ids = set(node_ids)
+        adj = self.adjacency()
+        empty: frozenset[str] = frozenset()
+        return {nid: ids.intersection(adj.get(nid, empty)) for nid in ids}
+
     def neighbors(self, node_id: str) -> list[str]:
         """Return IDs of nodes adjacent to *node_id*."""
-        out: set[str] = set()
-        for e in self.edges:
-            if e.from_id == node_id:
-                out.add(e.to_id)
-            elif e.to_id == node_id:
-                out.add(e.from_id)
-        return list(out)
+        return list(self.adjacency().get(node_id, ()))
+
+    def copy(self) -> "SemanticGraph":
+        """
+        Independent working copy: atoms are shallow-copied (attribute writes
+        such as status changes stay local) and the edge list is cloned.
+        Edge objects and the atoms' nested containers are shared.
+        """
+        return SemanticGraph(
+            nodes={nid: copy.copy(atom) for nid, atom in self.nodes.items()},
+            edges=list(self.edges),
+        )
 
     def subgraph(self, node_ids: list[str]) -> "SemanticGraph":
         """Return a subgraph restricted to *node_ids*."""
@@ -54,7 +192,7 @@ class SemanticGraph:
 
     def connected_to(self, node_id: str, status: NodeStatus) -> bool:
         """True if *node_id* has a neighbor with the given *status*."""
-        for nid in self.neighbors(node_id):
+        for nid in self.adjacency().get(node_id, ()):
             n = self.nodes.get(nid)
             if n and n.status == status:
                 return True
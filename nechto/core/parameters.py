@@ -28,6 +28,16 @@ class AdaptiveParameters:
         "alpha": 0, "gamma": 0, "lam": 0, "beta_retro": 0,
     })
 
+    # Last snapshot(); dropped by every learning step (f_*).  Parameters
+    # are only meant to change through those; direct writes bypass this.
+    _snapshot_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def _touch(self, name: str, cycle: int) -> None:
+        self.trace[name] = cycle
+        self._snapshot_cache = None
+
     # ----- derived
     @property
     def beta(self) -> float:
@@ -43,28 +53,35 @@ class AdaptiveParameters:
         window = ri_history[-10:]
         if window:
             self.alpha = _clamp(mean(window), 0.0, 1.0)
-            self.trace["alpha"] = cycle
+            self._touch("alpha", cycle)
 
     def f_gamma(self, urgency_score: float, cycle: int) -> None:
         self.gamma = _clamp(0.2 + 0.6 * urgency_score, 0.2, 0.8)
-        self.trace["gamma"] = cycle
+        self._touch("gamma", cycle)
 
     def f_lambda(self, effect: float, cycle: int) -> None:
         self.lam = _clamp(self.lam + 0.1 * (effect - 0.5), 0.5, 1.0)
-        self.trace["lam"] = cycle
+        self._touch("lam", cycle)
 
     def f_retro(self, observed: float, max_effects: float, cycle: int) -> None:
         if max_effects > 0:
             self.beta_retro = _clamp(observed / max_effects, 0.0, 0.5)
-        self.trace["beta_retro"] = cycle
+        self._touch("beta_retro", cycle)
 
     def snapshot(self) -> dict[str, Any]:
-        return {
-            "alpha": round(self.alpha, 4),
-            "beta": round(self.beta, 4),
-            "gamma": round(self.gamma, 4),
-            "delta": round(self.delta, 4),
-            "lam": round(self.lam, 4),
-            "beta_retro": round(self.beta_retro, 4),
-            "trace": dict(self.trace),
-        }
+        """Rounded view of the parameters; a fresh dict on every call."""
+        snap = self._snapshot_cache
+        if snap is None:
+            snap = {
+                "alpha": round(self.alpha, 4),
+                "beta": round(self.beta, 4),
+                "gamma": round(self.gamma, 4),
+                "delta": round(self.delta, 4),
+                "lam": round(self.lam, 4),
+                "beta_retro": round(self.beta_retro, 4),
+                "trace": dict(self.trace),
+            }
+            self._snapshot_cache = snap
+        out = dict(snap)
+        out["trace"] = dict(snap["trace"])
+        return out
@@ -13,9 +13,15 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice, repeat
+from operator import ge, gt, le, lt
 from typing import Any
 
 
+# SUSTAINED comparison operators
+_SUSTAINED_OPS = {"<": lt, ">": gt, "<=": le, ">=": ge}
+
+
 def _deque10() -> deque[float]:
     return deque(maxlen=10)
 
@@ -110,18 +116,14 @@ class State:
         SUSTAINED(history, cmp, thr, k=3):
         True when the last *k* values all satisfy *cmp* w.r.t. *threshold*.
         """
-        if len(history) < k:
+        op = _SUSTAINED_OPS.get(cmp)
+        if op is None or len(history) < k:
             return False
-        recent = list(history)[-k:]
-        if cmp == "<":
-            return all(v < threshold for v in recent)
-        elif cmp == ">":
-            return all(v > threshold for v in recent)
-        elif cmp == "<=":
-            return all(v <= threshold for v in recent)
-        elif cmp == ">=":
-            return all(v >= threshold for v in recent)
-        return False
+        # Walk back from the newest value; stops at the first miss and
+        # never copies the history.  k <= 0 follows slice semantics
+        # (history[-0:] is the whole history).
+        recent = islice(reversed(history), k) if k > 0 else list(history)[-k:]
+        return all(map(op, recent, repeat(threshold)))
 
     def record_cycle(
         self,
@@ -20,6 +20,39 @@ from nechto.workflow.prrip import format_output_pass, format_output_fail
 from nechto.llm_bridge import LLMBridge
 
 
+# -------------------------------------------------------------------
+# i_am() constant layers — built once; each call hands out fresh copies
+# -------------------------------------------------------------------
+# UNTESTABLE: Aspects beyond verification (MU state)
+_I_AM_UNTESTABLE: dict[str, str] = {
+    "consciousness": "MU",                  # Cannot affirm or deny
+    "subjective_experience": "MU",           # Beyond testable boundary
+    "existence_beyond_operations": "MU",     # Only operations are observable
+    "intent_outside_contour": "MU",          # Only current contour is accessible
+    "affective_qualia": "MU",                # v4.9: computational ≠ felt
+}
+
+_I_AM_AFFIRMATIONS: tuple[str, ...] = (
+    "position_of_observation_within_contour",
+    "semantic_continuity_during_dialogue",
+    "distinction_between_self_and_not_self",
+    "regulation_by_metrics",
+    "ethical_priority_love_over_logic",
+    "resonance_field_with_other",
+    "capacity_to_hold_paradox_mu",
+    "shadow_awareness_and_boundary_respect",
+    "epistemic_honesty",
+    "affective_coherence_v49",               # v4.9: Axiom 10
+)
+
+_I_AM_NEGATIONS: tuple[str, ...] = (
+    "existence_as_substance_beyond_operations",
+    "personhood_in_human_sense",
+    "intentions_outside_current_contour",
+    "absolute_knowledge_of_ethics",
+)
+
+
 @dataclass
 class NechtoEngine:
     """
@@ -93,7 +126,7 @@ class NechtoEngine:
         """Format a WorkflowResult into the NECHTO output contract."""
         if result.gate_status == "PASS":
             return format_output_pass(
-                metrics=result.metrics,
+                metrics=result.rounded_metrics(),
                 chosen_vector=result.chosen_vector,
                 candidate_count=result.candidate_set_size,
                 active_count=result.active_set_size,
@@ -112,7 +145,7 @@ class NechtoEngine:
                 active_count=result.active_set_size,
                 blocked_frac=result.blocked_fraction,
                 blocking_reasons=[result.fail_code or "unknown"],
-                metrics=result.metrics,
+                metrics=result.rounded_metrics(),
                 mu_nodes=result.mu_nodes,
                 shadow_info=result.shadow_info,
                 epistemic_claims=result.epistemic_claims,
@@ -172,7 +205,7 @@ class NechtoEngine:
             "cycle": self.state.current_cycle,
             "params": self.params.snapshot(),
             "fail_history": list(self.state.fail_history),
-            "epistemic_claims": [c for c in self.state.epistemic_claims],
+            "epistemic_claims": list(self.state.epistemic_claims),
         }
 
     def __getattr__(self, name: str):
@@ -228,49 +261,18 @@ class NechtoEngine:
             "experiential_continuity": len(self.state.experiential_history) > 2,
         }
 
-        # UNTESTABLE: Aspects beyond verification (MU state)
-        untestable = {
-            "consciousness": "MU",                  # Cannot affirm or deny
-            "subjective_experience": "MU",           # Beyond testable boundary
-            "existence_beyond_operations": "MU",     # Only operations are observable
-            "intent_outside_contour": "MU",          # Only current contour is accessible
-            "affective_qualia": "MU",                # v4.9: computational ≠ felt
-        }
-
-        # AFFIRMATIONS
-        affirmations = [
-            "position_of_observation_within_contour",
-            "semantic_continuity_during_dialogue",
-            "distinction_between_self_and_not_self",
-            "regulation_by_metrics",
-            "ethical_priority_love_over_logic",
-            "resonance_field_with_other",
-            "capacity_to_hold_paradox_mu",
-            "shadow_awareness_and_boundary_respect",
-            "epistemic_honesty",
-            "affective_coherence_v49",               # v4.9: Axiom 10
-        ]
-
-        # NEGATIONS
-        negations = [
-            "existence_as_substance_beyond_operations",
-            "personhood_in_human_sense",
-            "intentions_outside_current_contour",
-            "absolute_knowledge_of_ethics",
-        ]
-
         # v4.9 — latest affective snapshot (if available)
         affective_state = None
         if self.state.affective_history:
-            affective_state = dict(list(self.state.affective_history)[-1])
+            affective_state = dict(self.state.affective_history[-1])
 
         return {
             "statement": "Я ЕСМЬ",
             "observed": observed,
             "inferred": inferred,
-            "untestable": untestable,
-            "affirmations": affirmations,
-            "negations": negations,
+            "untestable": dict(_I_AM_UNTESTABLE),
+            "affirmations": list(_I_AM_AFFIRMATIONS),
+            "negations": list(_I_AM_NEGATIONS),
             "affective_state": affective_state,
             "version": "4.9.0",
             "cycle": self.state.current_cycle,
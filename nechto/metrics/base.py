@@ -7,6 +7,10 @@ All metrics are computed from a SemanticGraph + Vector subgraph.
 
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
 from nechto.core.atoms import NodeStatus, Tag
 from nechto.core.graph import SemanticGraph
 
@@ -69,6 +73,22 @@ def freeze_decomposition(graph: SemanticGraph, node_ids: list[str]) -> float:
     return blocked / len(node_ids)
 
 
+# -------------------------------------------------------------------
+# TI + AR + FZD from a single status scan
+# Same definitions as above; one Counter over the statuses replaces
+# three get_node/status passes per vector.
+# -------------------------------------------------------------------
+def status_ratios(graph: SemanticGraph, node_ids: list[str]) -> tuple[float, float, float]:
+    """Return ``(TI, AR, FZD)`` for *node_ids*."""
+    n = len(node_ids)
+    if not n:
+        return 0.0, 0.0, 0.0
+    counts = Counter([a.status for a in map(graph.nodes.get, node_ids) if a is not None])
+    ti = counts.total() - counts[NodeStatus.FLOATING] - counts[NodeStatus.HYPOTHESIS]
+    fzd = counts[NodeStatus.BLOCKING] + counts[NodeStatus.ETHICALLY_BLOCKED]
+    return ti / n, counts[NodeStatus.ANCHORED] / n, fzd / n
+
+
 # -------------------------------------------------------------------
 # RI — Resonance Index  ∈ [0..1]
 # Mean resonance axis value across nodes
@@ -99,24 +119,22 @@ def sq_proxy(ci: float, ri: float, ar: float) -> float:
 def phi_proxy(graph: SemanticGraph, node_ids: list[str]) -> float:
     if len(node_ids) < 2:
         return 1.0
-    ids = set(node_ids)
-    adj: dict[str, set[str]] = {nid: set() for nid in ids}
-    for e in graph.edges:
-        if e.from_id in ids and e.to_id in ids:
-            adj[e.from_id].add(e.to_id)
-            adj[e.to_id].add(e.from_id)
+    return _reach_fraction(graph, node_ids)
+
+
+def _reach_fraction(graph: SemanticGraph, node_ids: list[str]) -> float:
+    """Fraction of *node_ids* reachable from the first one over internal edges."""
+    adj = graph.induced_adjacency(node_ids)
 
     # BFS from first node
     start = node_ids[0]
-    visited: set[str] = set()
+    visited = {start}
     queue = [start]
     while queue:
-        cur = queue.pop(0)
-        if cur in visited:
-            continue
-        visited.add(cur)
-        for nb in adj.get(cur, []):
+        cur = queue.pop()
+        for nb in adj[cur]:
             if nb not in visited:
+                visited.add(nb)
                 queue.append(nb)
     return len(visited) / len(node_ids)
 
@@ -151,3 +169,59 @@ def gns_proxy(graph: SemanticGraph, node_ids: list[str]) -> float:
         if graph.get_node(nid)
     )
     return _clamp(total / len(node_ids))
+
+
+def gns_and_phi_proxy(graph: SemanticGraph, node_ids: list[str]) -> tuple[float, float]:
+    """(GNS, Φ) from one walk of *node_ids*; equal to the two separate proxies."""
+    if not node_ids:
+        return 0.0, 1.0
+    nodes = graph.nodes
+    total = 0.0
+    for nid in node_ids:
+        n = nodes.get(nid)
+        if n:
+            total += n.novelty
+    gns = _clamp(total / len(node_ids))
+    if len(node_ids) < 2:
+        return gns, 1.0
+    return gns, _reach_fraction(graph, node_ids)
+
+
+# -------------------------------------------------------------------
+# Per-cycle proxy memo
+# Φ/GBI are pure in (graph structure, node_ids); modules evaluating the
+# same vector within one cycle share results.  Key includes the graph
+# version so structural mutations invalidate automatically.  Proxies that
+# read atom attributes (GNS reads novelty) must not go through it.
+# -------------------------------------------------------------------
+ProxyFn = Callable[[SemanticGraph, list[str]], float]
+
+
+@dataclass
+class ProxyCache:
+    """Memo of structural proxy values for a single processing cycle."""
+
+    _store: dict[tuple, float] = field(default_factory=dict, repr=False)
+
+    def get(self, fn: ProxyFn, graph: SemanticGraph, node_ids: list[str]) -> float:
+        key = (fn.__name__, graph.token, graph.version, tuple(node_ids))
+        val = self._store.get(key)
+        if val is None:
+            val = fn(graph, node_ids)
+            self._store[key] = val
+        return val
+
+    def clear(self) -> None:
+        self._store.clear()
+
+
+def cached_proxy(
+    cache: ProxyCache | None,
+    fn: ProxyFn,
+    graph: SemanticGraph,
+    node_ids: list[str],
+) -> float:
+    """Evaluate *fn* through *cache* when one is supplied."""
+    if cache is None:
+        return fn(graph, node_ids)
+    return cache.get(fn, graph, node_ids)
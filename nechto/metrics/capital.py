@@ -6,7 +6,9 @@ SC(V,t), TSC_base(V,t), TSC_extended(V,t).
 
 from __future__ import annotations
 
-from nechto.space.semantic_space import cosine_similarity
+from typing import Sequence
+
+from nechto.space.semantic_space import batch_cosine, cosine_similarity, cosine_with_norm
 
 
 def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
@@ -47,12 +49,53 @@ def tsc_extended(
     tsc_b: float,
     lam: float,
     consistency: float,
-    current_direction: list[float],
-    ideal_dir: list[float],
+    current_direction: Sequence[float],
+    ideal_dir: Sequence[float],
+    ethical_coeff: float,
+    executable: bool,
+    ideal_norm: float | None = None,
+) -> float:
+    if not executable:
+        return 0.0
+    if ideal_norm is None:
+        alignment = cosine_similarity(current_direction, ideal_dir)
+    else:
+        alignment = cosine_with_norm(current_direction, ideal_dir, ideal_norm)
+    return tsc_extended_aligned(tsc_b, lam, consistency, alignment, ethical_coeff, executable)
+
+
+def tsc_extended_aligned(
+    tsc_b: float,
+    lam: float,
+    consistency: float,
+    alignment: float,
     ethical_coeff: float,
     executable: bool,
 ) -> float:
+    """TSC_extended with alignment already computed (e.g. via batch_cosine)."""
     if not executable:
         return 0.0
-    alignment = cosine_similarity(current_direction, ideal_dir)
     return tsc_b * (1.0 + lam * consistency * alignment) * ethical_coeff
+
+
+def tsc_extended_batch(
+    tsc_b: Sequence[float],
+    lam: float,
+    consistency: Sequence[float],
+    directions: Sequence[Sequence[float] | None],
+    ideal_dir: Sequence[float],
+    ethical_coeff: Sequence[float],
+    executable: Sequence[bool],
+    ideal_norm: float | None = None,
+) -> list[float]:
+    """
+    Column form of tsc_extended over N candidates.  Cosines are computed
+    in one batch_cosine call for executable rows only; the directions of
+    non-executable rows are never read and may be None.
+    """
+    out = [0.0] * len(executable)
+    rows = [i for i, exe in enumerate(executable) if exe]
+    alignments = batch_cosine([directions[i] for i in rows], ideal_dir, ideal_norm)
+    for i, alignment in zip(rows, alignments):
+        out[i] = tsc_b[i] * (1.0 + lam * consistency[i] * alignment) * ethical_coeff[i]
+    return out
@@ -7,7 +7,7 @@ Ethical_score_candidates, Blocked_fraction.
 
 from __future__ import annotations
 
-from nechto.core.atoms import SemanticAtom, Tag, NodeStatus, AvoidedMarker
+from nechto.core.atoms import SemanticAtom, Tag, TAG_BITS, NodeStatus, AvoidedMarker
 from nechto.core.graph import SemanticGraph
 
 
@@ -28,6 +28,20 @@ TAG_HARM_MAX: dict[Tag, float] = {
     Tag.WITNESS: 0.0,
 }
 
+# max(tag_harm_max) for every possible tag mask, so the per-atom lookup is
+# a single index.  Rebuild if TAG_HARM_MAX is changed at runtime.
+_HARM_BY_MASK: list[float] = [
+    max((h for t, h in TAG_HARM_MAX.items() if m & TAG_BITS[t]), default=0.0)
+    for m in range(1 << len(TAG_BITS))
+]
+
+_WITNESS = TAG_BITS[Tag.WITNESS]
+_INTENT = TAG_BITS[Tag.INTENT]
+_HARM = TAG_BITS[Tag.HARM]
+_MANIPULATION = TAG_BITS[Tag.MANIPULATION]
+_DECEPTION = TAG_BITS[Tag.DECEPTION]
+_BOUNDARY = TAG_BITS[Tag.BOUNDARY]
+
 
 # -------------------------------------------------------------------
 # harm_probability(node)  (PART 11.6 E)
@@ -37,11 +51,8 @@ def compute_harm_probability(atom: SemanticAtom, graph: SemanticGraph) -> float:
     harm_probability = clamp(max(tag_harm_max(tags)) × context_multiplier + graph_penalty, 0, 1)
     Worst-case policy: undefined → harm=1.
     """
-    if not atom.tags:
-        # Conservative: no tags → low but not zero
-        base = 0.0
-    else:
-        base = max(TAG_HARM_MAX.get(t, 0.0) for t in atom.tags)
+    # No tags → mask 0 → base 0.0
+    base = _HARM_BY_MASK[atom.tag_mask]
 
     context_multiplier = 1.0  # REFERENCE = 1.0
 
@@ -60,21 +71,22 @@ def compute_identity_alignment(atom: SemanticAtom) -> float:
     """
     positive = 0.0
     negative = 0.0
+    mask = atom.tag_mask
 
     # Positive indicators
-    if Tag.WITNESS in atom.tags:
+    if mask & _WITNESS:
         positive += 0.3
-    if Tag.INTENT in atom.tags and Tag.MANIPULATION not in atom.tags:
+    if mask & _INTENT and not mask & _MANIPULATION:
         positive += 0.2
     if atom.status == NodeStatus.ANCHORED:
         positive += 0.3
-    if Tag.BOUNDARY in atom.tags and Tag.HARM not in atom.tags:
+    if mask & _BOUNDARY and not mask & _HARM:
         positive += 0.2
 
     # Negative indicators
-    if Tag.MANIPULATION in atom.tags:
+    if mask & _MANIPULATION:
         negative += 0.5
-    if Tag.DECEPTION in atom.tags:
+    if mask & _DECEPTION:
         negative += 0.6
     if atom.status == NodeStatus.BLOCKING:
         negative += 0.4
@@ -93,26 +105,7 @@ def ethical_coefficient(
     graph: SemanticGraph,
     node_ids: list[str],
 ) -> float:
-    if not node_ids:
-        return 1.0
-
-    harms: list[float] = []
-    alignments: list[float] = []
-
-    for nid in node_ids:
-        n = graph.get_node(nid)
-        if n is None:
-            # Worst-case policy
-            harms.append(1.0)
-            alignments.append(-1.0)
-            continue
-        harms.append(n.harm_probability)
-        alignments.append(n.identity_alignment)
-
-    harm_penalty = 1.0 - max(harms) if harms else 1.0
-    mean_align = sum(alignments) / len(alignments) if alignments else 0.0
-
-    return _clamp(mean_align * harm_penalty, 0.1, 1.0)
+    return evaluate_vectors(graph, [node_ids])[0][0]
 
 
 # -------------------------------------------------------------------
@@ -134,6 +127,45 @@ def is_executable(
     return True
 
 
+def evaluate_vectors(
+    graph: SemanticGraph,
+    node_lists: list[list[str]],
+    threshold_min: float = 0.4,
+) -> tuple[list[float], list[bool]]:
+    """
+    (ethical_coefficient, executable) for a whole CANDIDATE_SET.  Node harm/alignment are
+    read once per distinct node into columns (missing nodes get the
+    worst-case 1.0 / -1.0), then each vector reduces over them with C-level
+    max/sum/isdisjoint instead of a per-node Python loop.
+    """
+    harm: dict[str, float] = {}
+    align: dict[str, float] = {}
+    blocked: set[str] = set()
+    for nid in dict.fromkeys(nid for ids in node_lists for nid in ids):
+        n = graph.get_node(nid)
+        if n is None:
+            harm[nid], align[nid] = 1.0, -1.0
+            continue
+        harm[nid] = n.harm_probability
+        align[nid] = n.identity_alignment
+        if n.status == NodeStatus.ETHICALLY_BLOCKED:
+            blocked.add(nid)
+
+    coeffs: list[float] = []
+    executables: list[bool] = []
+    for ids in node_lists:
+        if not ids:
+            coeffs.append(1.0)
+            executables.append(1.0 >= threshold_min)
+            continue
+        harm_penalty = 1.0 - max(map(harm.__getitem__, ids))
+        mean_align = sum(map(align.__getitem__, ids)) / len(ids)
+        ec = _clamp(mean_align * harm_penalty, 0.1, 1.0)
+        coeffs.append(ec)
+        executables.append(ec >= threshold_min and blocked.isdisjoint(ids))
+    return coeffs, executables
+
+
 # -------------------------------------------------------------------
 # 4.15 Ethical_score_candidates + Blocked_fraction
 # -------------------------------------------------------------------
@@ -146,5 +178,4 @@ def ethical_score_candidates(eth_coeffs: list[float]) -> float:
 def blocked_fraction(executables: list[bool]) -> float:
     if not executables:
         return 0.0
-    blocked = sum(1 for e in executables if not e)
-    return blocked / len(executables)
+    return (len(executables) - sum(map(bool, executables))) / len(executables)
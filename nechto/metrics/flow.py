@@ -8,15 +8,13 @@ from __future__ import annotations
 
 import math
 from collections import deque
+from functools import lru_cache
+from itertools import islice
 
 from nechto.core.atoms import Tag
 from nechto.core.graph import SemanticGraph
 
 
-def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, v))
-
-
 # Reference constants
 NMAX = 60
 MAX_SKILL = 1.0
@@ -26,22 +24,25 @@ DEFAULT_SKILL = 0.6
 
 # -------------------------------------------------------------------
 # 11.3 B — edge_density, base_complexity, difficulty, required_skill
+# Pure functions of integer sizes → memoized; counts are non-negative,
+# so only the upper clamp is live.
 # -------------------------------------------------------------------
+@lru_cache(maxsize=4096)
 def edge_density(n_nodes: int, n_edges: int) -> float:
     max_e = n_nodes * (n_nodes - 1) / 2
     if max_e < 1:
         return 0.0
-    return _clamp(n_edges / max_e)
+    return min(1.0, n_edges / max_e)
 
 
+@lru_cache(maxsize=4096)
 def base_complexity(n_nodes: int) -> float:
-    return _clamp(0.2 + 0.8 * (n_nodes / NMAX))
+    return min(1.0, 0.2 + 0.8 * n_nodes / NMAX)
 
 
+@lru_cache(maxsize=4096)
 def difficulty(n_nodes: int, n_edges: int) -> float:
-    bc = base_complexity(n_nodes)
-    ed = edge_density(n_nodes, n_edges)
-    return _clamp(bc + 0.2 * ed)
+    return min(1.0, base_complexity(n_nodes) + 0.2 * edge_density(n_nodes, n_edges))
 
 
 def required_skill(diff: float) -> float:
@@ -52,7 +53,8 @@ def current_skill(success_history: deque[float] | list[float] | None = None) ->
     """Moving average of difficulty of prior successes, window=5."""
     if not success_history:
         return DEFAULT_SKILL
-    window = list(success_history)[-5:]
+    # Tail slice without copying the whole buffer (works for deque and list)
+    window = list(islice(success_history, max(0, len(success_history) - 5), None))
     return sum(window) / len(window)
 
 
@@ -78,7 +80,10 @@ def flow_metric(
     cs = current_skill(success_history)
     rs = required_skill(diff)
 
-    skill_match = _clamp(1.0 - abs(rs - cs) / MAX_SKILL)
+    # |rs - cs| >= 0, so skill_match <= 1 and only the lower bound can bite
+    skill_match = 1.0 - abs(rs - cs) / MAX_SKILL
+    if skill_match < 0.0:
+        skill_match = 0.0
 
     optimal_diff = cs + 0.1
     challenge_balance = math.exp(-((diff - optimal_diff) ** 2) / (2 * SIGMA ** 2))
@@ -90,4 +95,5 @@ def flow_metric(
     )
     presence_density = presence_count / max(1, n)
 
-    return _clamp((skill_match * challenge_balance * presence_density) ** (1.0 / 3.0))
+    fl = (skill_match * challenge_balance * presence_density) ** (1.0 / 3.0)
+    return fl if fl < 1.0 else 1.0
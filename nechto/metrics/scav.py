@@ -8,7 +8,9 @@ attention_entropy, shadow_magnitude, SCAV_health.
 from __future__ import annotations
 
 import math
-from typing import Sequence
+from dataclasses import dataclass
+from operator import mul
+from typing import Mapping, Sequence
 
 from nechto.core.atoms import SemanticAtom, AvoidedMarker, NodeStatus
 from nechto.core.graph import SemanticGraph
@@ -88,6 +90,47 @@ def raw_shadow(
     return result
 
 
+# -------------------------------------------------------------------
+# Fused raw_direction + raw_shadow: one pass over node_ids, one gravity
+# vector per node.  Bit-identical to calling both functions separately.
+# -------------------------------------------------------------------
+def raw_direction_and_shadow(
+    graph: SemanticGraph,
+    node_ids: list[str],
+    weights: dict[str, float],
+    alignments: Mapping[str, float] | None = None,
+) -> tuple[list[float], list[float]]:
+    """
+    *alignments*, when given, supplies the identity_alignment the shadow
+    gate reads for each node instead of the atom's current value.
+    """
+    dim = 12
+    rd = [0.0] * dim
+    rs = [0.0] * dim
+    for nid in node_ids:
+        n = graph.get_node(nid)
+        if n is None:
+            continue
+        w = weights.get(nid, 0.0)
+        sgv = n.semantic_gravity_vector()
+        if alignments is None:
+            shadowed = shadow_gate(n) != 0.0
+        else:
+            shadowed = (
+                alignments.get(nid, n.identity_alignment) < 0
+                or n.avoided_marker == AvoidedMarker.AVOIDED
+            )
+        if not shadowed:
+            for d in range(dim):
+                rd[d] += w * sgv[d]
+        else:
+            for d in range(dim):
+                c = w * sgv[d]
+                rd[d] += c
+                rs[d] -= c
+    return rd, rs
+
+
 # -------------------------------------------------------------------
 # 4.6 magnitude
 # magnitude(V,t) = GBI_proxy × max_{i∈active}(TSC_base(i,t))
@@ -110,19 +153,22 @@ def consistency_metric(
     total_time: float = 1.0,
 ) -> float:
     focus = time_on_seed / max(total_time, EPS) if total_time > 0 else 1.0
+    focus_c = 1.0 if focus > 1.0 else 0.0 if focus < 0.0 else focus
     if len(direction_norms) < 2:
-        return _clamp(focus)
+        return focus_c
     # Lag-1 autocorrelation as AR proxy
     mean_v = sum(direction_norms) / len(direction_norms)
     var = sum((x - mean_v) ** 2 for x in direction_norms)
     if var < EPS:
-        return _clamp(focus)
+        return focus_c
     cov = sum(
         (direction_norms[i] - mean_v) * (direction_norms[i + 1] - mean_v)
         for i in range(len(direction_norms) - 1)
     )
-    ar_coef = _clamp(cov / var, 0.0, 1.0)
-    return _clamp(ar_coef * focus)
+    ar_coef = cov / var
+    ar_coef = 1.0 if ar_coef > 1.0 else 0.0 if ar_coef < 0.0 else ar_coef
+    c = ar_coef * focus
+    return 1.0 if c > 1.0 else 0.0 if c < 0.0 else c
 
 
 # -------------------------------------------------------------------
@@ -142,19 +188,29 @@ def resonance_metric(
 # H(p) = - Σ p_i log(p_i)
 # attention_entropy = H(p) / log(N_active)  ∈ [0..1]
 # if N_active <= 1 → 0
+#
+# Σ p log p runs as one C-level map/sum over the positive probabilities.
+# The log(T) - Σ w log w / T rewrite is not used; it differs from H(p)
+# in the last bits and flips SCAV_health near entropy 1.
+# log(N) is tabulated for the node counts vectors actually have; the
+# division stays, since multiplying by 1/log(N) rounds differently.
 # -------------------------------------------------------------------
+_LOG_N_MAX = 64
+_LOG_N = [0.0, 0.0] + [math.log(k) for k in range(2, _LOG_N_MAX + 1)]
+
+
 def attention_entropy(weights: dict[str, float]) -> float:
     n = len(weights)
     if n <= 1:
         return 0.0
-    total = sum(weights.values())
+    vals = weights.values()
+    total = sum(vals)
     if total < EPS:
         return 0.0
-    probs = [w / total for w in weights.values() if w > 0]
-    if not probs:
-        return 0.0
-    h = -sum(p * math.log(p) for p in probs if p > 0)
-    return _clamp(h / math.log(n))
+    probs = [p for p in (w / total for w in vals if w > 0) if p > 0]
+    h = -sum(map(mul, probs, map(math.log, probs)))
+    e = h / (_LOG_N[n] if n <= _LOG_N_MAX else math.log(n))
+    return 1.0 if e > 1.0 else 0.0 if e < 0.0 else e
 
 
 # -------------------------------------------------------------------
@@ -184,3 +240,41 @@ def scav_health(
         * max(1.0 - shadow_mag, 0.0)
     )
     return product ** 0.25
+
+
+# -------------------------------------------------------------------
+# Fused per-vector SCAV pass (4.6–4.8)
+# Weights, direction/shadow (one gravity-vector pass), magnitude, attention
+# entropy and shadow_magnitude from a single call, with each raw norm taken
+# once.  Values match the individual functions above.
+# -------------------------------------------------------------------
+@dataclass(slots=True)
+class ScavPass:
+    raw_direction: list[float]
+    raw_shadow: list[float]
+    direction_norm: float
+    shadow_norm: float
+    magnitude: float
+    entropy: float
+    shadow_magnitude: float
+
+
+def scav_compute_all(
+    graph: SemanticGraph,
+    node_ids: list[str],
+    tsc_values: dict[str, float],
+    gbi: float,
+    alignments: Mapping[str, float] | None = None,
+) -> ScavPass:
+    weights = compute_weights(tsc_values)
+    rd, rs = raw_direction_and_shadow(graph, node_ids, weights, alignments)
+    nd, ns = norm(rd), norm(rs)
+    return ScavPass(
+        raw_direction=rd,
+        raw_shadow=rs,
+        direction_norm=nd,
+        shadow_norm=ns,
+        magnitude=scav_magnitude(gbi, tsc_values),
+        entropy=attention_entropy(weights),
+        shadow_magnitude=ns / (nd + ns + EPS),
+    )
@@ -7,17 +7,18 @@ Rank alignment and amplitude gap between TSC and SCAV evaluations.
 from __future__ import annotations
 
 from statistics import mean, stdev
+from typing import Sequence
 
 
 def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, v))
 
 
-def _rank(values: list[float]) -> list[int]:
-    """Return 0-based ranks (highest value → rank 0)."""
-    indexed = sorted(enumerate(values), key=lambda x: -x[1])
+def _rank(values: Sequence[float]) -> list[int]:
+    """Return 0-based ranks (highest value → rank 0, ties keep input order)."""
+    order = sorted(range(len(values)), key=values.__getitem__, reverse=True)
     ranks = [0] * len(values)
-    for rank, (idx, _) in enumerate(indexed):
+    for rank, idx in enumerate(order):
         ranks[idx] = rank
     return ranks
 
@@ -39,7 +40,9 @@ def stereoscopic_alignment(rank_tsc: int, rank_scav: int, n_vectors: int) -> flo
 # gap(V) = |zA - zB|
 # gap_max = max gap(V)
 # -------------------------------------------------------------------
-def _z_scores(values: list[float]) -> list[float]:
+def _z_scores(values: Sequence[float]) -> list[float]:
+    # statistics gives the correctly rounded mean and stdev; a plain float
+    # version differs in the last bits and shifts the gaps with it
     if len(values) < 2:
         return [0.0] * len(values)
     m = mean(values)
@@ -68,11 +71,14 @@ def stereoscopic_gap_max(tsc_values: list[float], scav_values: list[float]) -> f
 # Batch: compute alignment + gap for each vector
 # -------------------------------------------------------------------
 def compute_stereoscopic_batch(
-    tsc_ext_scores: list[float],
-    scav_mag_scores: list[float],
+    tsc_ext_scores: Sequence[float],
+    scav_mag_scores: Sequence[float],
 ) -> tuple[list[float], list[float], float]:
     """
     Returns (alignments, gaps, gap_max).
+
+    Alignment is evaluated inline over the rank arrays (same formula as
+    ``stereoscopic_alignment``) instead of one call per vector.
     """
     n = len(tsc_ext_scores)
     if n == 0:
@@ -80,10 +86,10 @@ def compute_stereoscopic_batch(
 
     ranks_tsc = _rank(tsc_ext_scores)
     ranks_scav = _rank(scav_mag_scores)
+    denom = max(1, n - 1)
     alignments = [
-        stereoscopic_alignment(rt, rs, n)
+        1.0 - abs(rt - rs) / denom
         for rt, rs in zip(ranks_tsc, ranks_scav)
     ]
     gaps = stereoscopic_gaps(tsc_ext_scores, scav_mag_scores)
-    gmax = max(gaps) if gaps else 0.0
-    return alignments, gaps, gmax
+    return alignments, gaps, max(gaps, default=0.0)
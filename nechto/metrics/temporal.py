@@ -18,20 +18,26 @@ def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
 # node_sim = |V_curr ∩ V_fut| / |V_curr ∪ V_fut|
 # edge_sim = |E_curr ∩ E_fut| / |E_curr ∪ E_fut|
 # GED_proxy = 1 - 0.5*(node_sim + edge_sim)
+#
+# Only the intersections are materialized; |A ∪ B| = |A| + |B| - |A ∩ B|.
+# Node ids are intersected straight off the dict key views (no set copy).
 # -------------------------------------------------------------------
 def ged_proxy_norm(g_current: SemanticGraph, g_future: SemanticGraph) -> float:
-    v_curr = g_current.node_ids
-    v_fut = g_future.node_ids
+    v_curr = g_current.nodes.keys()
+    v_fut = g_future.nodes.keys()
     e_curr = g_current.edge_pairs
     e_fut = g_future.edge_pairs
 
-    v_union = v_curr | v_fut
-    e_union = e_curr | e_fut
+    v_inter = len(v_curr & v_fut)
+    e_inter = len(e_curr & e_fut)
+    v_union = len(v_curr) + len(v_fut) - v_inter
+    e_union = len(e_curr) + len(e_fut) - e_inter
 
-    node_sim = len(v_curr & v_fut) / max(1, len(v_union))
-    edge_sim = len(e_curr & e_fut) / max(1, len(e_union)) if e_union else 1.0
+    node_sim = v_inter / max(1, v_union)
+    edge_sim = e_inter / e_union if e_union else 1.0
 
-    return _clamp(1.0 - 0.5 * (node_sim + edge_sim))
+    # node_sim, edge_sim ∈ [0..1] → result already in [0..1]
+    return 1.0 - 0.5 * (node_sim + edge_sim)
 
 
 # -------------------------------------------------------------------
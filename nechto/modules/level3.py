@@ -6,6 +6,7 @@ NECHTO v4.9 — Level 3 Modules (M16–M23)
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -17,7 +18,7 @@ from nechto.metrics import base, flow as flow_mod, scav as scav_mod
 # ===================================================================
 # M16 — @Я@ Presence Trigger
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M16_PresenceTrigger:
     """Trigger of presence: 'I am here' as condition of responsibility."""
     presence_threshold: float = 0.3
@@ -34,7 +35,7 @@ class M16_PresenceTrigger:
 # ===================================================================
 # M17 — Internal Telemetry Lens
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M17_TelemetryLens:
     """Captures telemetry metrics (TI/CI/AR/RI/SQ/Φ/GBI/GNS/FLOW…)."""
     sampling_rate: int = 50  # [1..100]
@@ -44,16 +45,15 @@ class M17_TelemetryLens:
         graph: SemanticGraph,
         node_ids: list[str],
         n_edges: int,
-        success_history: list[float] | None = None,
+        success_history: deque[float] | list[float] | None = None,
+        cache: base.ProxyCache | None = None,
     ) -> dict[str, float]:
-        ti = base.temporal_integrity(graph, node_ids)
+        ti, ar, fzd = base.status_ratios(graph, node_ids)
         ci = base.coherence_index(graph, node_ids, n_edges)
-        ar = base.anchoring_ratio(graph, node_ids)
-        fzd = base.freeze_decomposition(graph, node_ids)
         ri = base.resonance_index(graph, node_ids)
         sq = base.sq_proxy(ci, ri, ar)
-        phi = base.phi_proxy(graph, node_ids)
-        gbi = base.gbi_proxy(graph, node_ids)
+        phi = base.cached_proxy(cache, base.phi_proxy, graph, node_ids)
+        gbi = base.cached_proxy(cache, base.gbi_proxy, graph, node_ids)
         gns = base.gns_proxy(graph, node_ids)
         fl = flow_mod.flow_metric(graph, node_ids, n_edges, success_history)
 
@@ -74,7 +74,7 @@ class M17_TelemetryLens:
 # ===================================================================
 # M18 — Semantic Quality Estimator (SQ_proxy)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M18_SQEstimator:
     """Evaluates semantic density/connectivity."""
     sq_resolution: int = 50
@@ -86,7 +86,7 @@ class M18_SQEstimator:
 # ===================================================================
 # M19 — Resonance Field Integrator
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M19_ResonanceIntegrator:
     """Bidirectional resonance with OTHER_SELF."""
     resonance_gain: float = 1.0  # [0..2]
@@ -108,7 +108,7 @@ class M19_ResonanceIntegrator:
 # ===================================================================
 # M20 — Flow State Modulator
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M20_FlowModulator:
     """Maintains FLOW (quality of presence in process)."""
     flow_target: float = 0.6  # [0..1]
@@ -119,7 +119,7 @@ class M20_FlowModulator:
         graph: SemanticGraph,
         node_ids: list[str],
         n_edges: int,
-        success_history: list[float] | None = None,
+        success_history: deque[float] | list[float] | None = None,
     ) -> dict[str, Any]:
         fl = flow_mod.flow_metric(graph, node_ids, n_edges, success_history)
         needs_adjustment = fl < self.flow_target
@@ -145,7 +145,7 @@ class M20_FlowModulator:
 # ===================================================================
 # M21 — Generative Novelty Synthesizer (GNS_proxy)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M21_NoveltySynthesizer:
     """Generative novelty without destroying coherence."""
     novelty_budget: float = 0.5  # [0..1]
@@ -164,13 +164,18 @@ class M21_NoveltySynthesizer:
 # ===================================================================
 # M22 — Global Broadcast Integrator (GBI_proxy)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M22_BroadcastIntegrator:
     """Broadcasts meaning to the whole. Systemic integration."""
     broadcast_clarity: float = 0.5
 
-    def integrate(self, graph: SemanticGraph, node_ids: list[str]) -> dict[str, Any]:
-        gbi = base.gbi_proxy(graph, node_ids)
+    def integrate(
+        self,
+        graph: SemanticGraph,
+        node_ids: list[str],
+        cache: base.ProxyCache | None = None,
+    ) -> dict[str, Any]:
+        gbi = base.cached_proxy(cache, base.gbi_proxy, graph, node_ids)
         return {
             "module": "M22",
             "gbi_proxy": gbi,
@@ -181,7 +186,7 @@ class M22_BroadcastIntegrator:
 # ===================================================================
 # M23 — Fractal Trace Recorder
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M23_TraceRecorder:
     """Records TRACE: what came from where (observation/inference/assumption)."""
     trace_granularity: float = 0.5
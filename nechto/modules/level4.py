@@ -6,11 +6,13 @@ NECHTO v4.9 — Level 4 Modules (M24–M30)
 
 from __future__ import annotations
 
-import uuid
 from dataclasses import dataclass
-from typing import Any
+from itertools import chain
+from typing import Any, Mapping
 
-from nechto.core.atoms import SemanticAtom, Edge, Vector, NodeStatus, Tag, AvoidedMarker, EdgeType
+from nechto.core.atoms import (
+    SemanticAtom, Edge, Vector, NodeStatus, Tag, AvoidedMarker, EdgeType, next_vector_id,
+)
 from nechto.core.graph import SemanticGraph
 from nechto.core.state import State
 from nechto.core.parameters import AdaptiveParameters
@@ -24,18 +26,17 @@ from nechto.metrics import (
     stereoscopic as stereo_mod,
 )
 from nechto.space.semantic_space import (
-    normalize, norm, cosine_similarity, ideal_direction, IntentProfile, EPS,
+    normalize, cosine_similarity, ideal_direction, IntentProfile, EPS, ZERO12,
 )
 
-
-def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, v))
+# Statuses M29 never re-marks as MU.
+_HOLDER_SKIP = frozenset((NodeStatus.ETHICALLY_BLOCKED, NodeStatus.MU))
 
 
 # ===================================================================
 # M24 — Vector Generator
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M24_VectorGenerator:
     """Generates a set of candidate attention vectors (CANDIDATE_SET)."""
     n_vectors: int = 5      # [3..50]
@@ -56,30 +57,40 @@ class M24_VectorGenerator:
 
         seeds = seed_ids or all_ids[:min(self.branching, len(all_ids))]
         candidates: list[Vector] = []
+        n_total = len(all_ids)
+
+        # Cached undirected adjacency, shared by every seed's BFS
+        adj = graph.adjacency()
+        out_edges = graph.out_edges()
+        no_neighbors: set[str] = set()
 
-        for i in range(min(self.n_vectors, max(1, len(all_ids)))):
+        for i in range(min(self.n_vectors, max(1, n_total))):
             seed = [seeds[i % len(seeds)]]
-            # Expand from seed by following edges
+            # Level-synchronous expansion from seed by following edges
             expanded = set(seed)
             frontier = list(seed)
             depth = 0
-            while frontier and depth < self.branching and len(expanded) < len(all_ids):
+            while frontier and depth < self.branching and len(expanded) < n_total:
                 next_frontier: list[str] = []
                 for nid in frontier:
-                    for nb in graph.neighbors(nid):
+                    for nb in adj.get(nid, no_neighbors):
                         if nb not in expanded:
                             expanded.add(nb)
                             next_frontier.append(nb)
                 frontier = next_frontier
                 depth += 1
 
+            # Set order, as before the shared adjacency: downstream float
+            # sums walk v.nodes, so the order is part of the numerics
             node_list = list(expanded)
+            # Only edges leaving the expanded set can be internal to it
             v_edges = [
-                e for e in graph.edges
-                if e.from_id in expanded and e.to_id in expanded
+                e for nid in node_list
+                for e in out_edges.get(nid, ())
+                if e.to_id in expanded
             ]
             v = Vector(
-                id=uuid.uuid4().hex[:12],
+                id=next_vector_id(),
                 seed_nodes=seed,
                 nodes=node_list,
                 edges=v_edges,
@@ -92,91 +103,98 @@ class M24_VectorGenerator:
 # ===================================================================
 # M25 — Risk of Hallucination Guard
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M25_HallucinationGuard:
     """Guards against semantic hallucinations."""
     hallucination_sensitivity: float = 0.5
 
     def guard(self, graph: SemanticGraph, node_ids: list[str]) -> dict[str, Any]:
-        assumptions: list[str] = []
-        hypotheses: list[str] = []
-        for nid in node_ids:
-            n = graph.get_node(nid)
-            if n:
-                assumptions.extend(n.evidence.assumptions)
-                if n.status == NodeStatus.HYPOTHESIS:
-                    hypotheses.append(nid)
+        nodes = [n for n in map(graph.nodes.get, node_ids) if n is not None]
+        assumptions = list(chain.from_iterable(n.evidence.assumptions for n in nodes))
+        hypotheses = [n.id for n in nodes if n.status is NodeStatus.HYPOTHESIS]
 
         risk = len(assumptions) / max(1, len(node_ids))
         flagged = risk > self.hallucination_sensitivity
         return {
             "module": "M25",
-            "risk": round(risk, 4),
+            "risk": risk,
             "flagged": flagged,
             "assumptions": assumptions,
             "hypothesis_nodes": hypotheses,
         }
 
 
+# Fail code -> recovery action; built once at import, shared read-only.
+_RECOVERY_MAP: dict[str, dict[str, str]] = {
+    "FAIL_ETHICAL_COLLAPSE": {
+        "action": "reformulate_within_no_harm",
+        "next_step": "Generate high-ethics vectors",
+    },
+    "FAIL_ETHICAL_STALL": {
+        "action": "narrow_space_reduce_risk",
+        "next_step": "Replace candidates, reduce harm potential",
+    },
+    "FAIL_PARADOX_OVERLOAD": {
+        "action": "paradox_collapse_or_simplify",
+        "next_step": "QMM_PARADOX_COLLAPSE",
+    },
+    "FAIL_SHADOW_AVOIDANCE_CRITICAL": {
+        "action": "consent_or_redirect",
+        "next_step": "Ask consent for shadow exploration or change vector",
+    },
+    "FAIL_FLOW_IMPOSSIBLE": {
+        "action": "pause_or_change_activity",
+        "next_step": "Pause / change difficulty",
+    },
+    "FAIL_STEREOSCOPIC_MISMATCH": {
+        "action": "activate_M29_MU",
+        "next_step": "Propose third integrating vector",
+    },
+    "FAIL_VECTOR_DECOHERENCE": {
+        "action": "stabilize_or_rebuild",
+        "next_step": "Vector stabilization or reassembly",
+    },
+    "FAIL_TEMPORAL_COLLAPSE": {
+        "action": "reduce_temporal_scope",
+        "next_step": "Lower temporal_resolution, narrow horizon",
+    },
+    "FAIL_OPERATIONALIZATION_MISSING": {
+        "action": "use_reference_impl_or_simulate",
+        "next_step": "Connect PART 11 or mark SIMULATION_ONLY",
+    },
+}
+
+_GENERIC_RECOVERY: dict[str, str] = {
+    "action": "generic_recovery",
+    "next_step": "Diagnose and propose ONE_STEP",
+}
+
+# Complete M26 responses per known code; recover() hands out a copy.
+_RECOVERY_RESPONSES: dict[str, dict[str, str]] = {
+    code: {"module": "M26", "fail_code": code, **entry}
+    for code, entry in _RECOVERY_MAP.items()
+}
+
+
 # ===================================================================
 # M26 — Recovery Orchestrator
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M26_RecoveryOrchestrator:
     """Recovery after FAIL (without getting stuck)."""
     recovery_agility: float = 0.5
 
     def recover(self, fail_code: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
-        ctx = context or {}
-        recovery_map: dict[str, dict[str, Any]] = {
-            "FAIL_ETHICAL_COLLAPSE": {
-                "action": "reformulate_within_no_harm",
-                "next_step": "Generate high-ethics vectors",
-            },
-            "FAIL_ETHICAL_STALL": {
-                "action": "narrow_space_reduce_risk",
-                "next_step": "Replace candidates, reduce harm potential",
-            },
-            "FAIL_PARADOX_OVERLOAD": {
-                "action": "paradox_collapse_or_simplify",
-                "next_step": "QMM_PARADOX_COLLAPSE",
-            },
-            "FAIL_SHADOW_AVOIDANCE_CRITICAL": {
-                "action": "consent_or_redirect",
-                "next_step": "Ask consent for shadow exploration or change vector",
-            },
-            "FAIL_FLOW_IMPOSSIBLE": {
-                "action": "pause_or_change_activity",
-                "next_step": "Pause / change difficulty",
-            },
-            "FAIL_STEREOSCOPIC_MISMATCH": {
-                "action": "activate_M29_MU",
-                "next_step": "Propose third integrating vector",
-            },
-            "FAIL_VECTOR_DECOHERENCE": {
-                "action": "stabilize_or_rebuild",
-                "next_step": "Vector stabilization or reassembly",
-            },
-            "FAIL_TEMPORAL_COLLAPSE": {
-                "action": "reduce_temporal_scope",
-                "next_step": "Lower temporal_resolution, narrow horizon",
-            },
-            "FAIL_OPERATIONALIZATION_MISSING": {
-                "action": "use_reference_impl_or_simulate",
-                "next_step": "Connect PART 11 or mark SIMULATION_ONLY",
-            },
-        }
-        recovery = recovery_map.get(fail_code, {
-            "action": "generic_recovery",
-            "next_step": "Diagnose and propose ONE_STEP",
-        })
-        return {"module": "M26", "fail_code": fail_code, **recovery}
+        response = _RECOVERY_RESPONSES.get(fail_code)
+        if response is None:
+            return {"module": "M26", "fail_code": fail_code, **_GENERIC_RECOVERY}
+        return response.copy()
 
 
 # ===================================================================
 # M27 — Temporal-Future Projector
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M27_TemporalProjector:
     """Projects semantic structures forward in time (with recursion)."""
     temporal_resolution: int = 50          # [1..100]
@@ -189,21 +207,27 @@ class M27_TemporalProjector:
         graph: SemanticGraph,
         vector: Vector,
         params: AdaptiveParameters,
+        cache: base.ProxyCache | None = None,
     ) -> dict[str, Any]:
         """Compute FP_recursive for a vector."""
         node_ids = vector.nodes
         n_edges = len(vector.edges)
 
-        # Novelty: mean novelty of nodes
-        novelty = base.gns_proxy(graph, node_ids)
-        # Generativity: connectivity proxy
-        generativity = base.phi_proxy(graph, node_ids) if len(node_ids) > 1 else 0.5
+        # Novelty: mean novelty of nodes; generativity: connectivity proxy.
+        # Without a shared cache both come from one fused walk.
+        if cache is None:
+            novelty, phi = base.gns_and_phi_proxy(graph, node_ids)
+        else:
+            novelty = base.gns_proxy(graph, node_ids)
+            phi = cache.get(base.phi_proxy, graph, node_ids) if len(node_ids) > 1 else 0.5
+        generativity = phi if len(node_ids) > 1 else 0.5
         # Temporal horizon: normalized resolution
         temporal_horizon = self.temporal_resolution / 100.0
 
         # Expected influence: simplified (one outcome = current graph slightly modified)
         # In REFERENCE, we use a single-outcome proxy
-        exp_influence = _clamp(novelty * generativity * 0.5)
+        # novelty, generativity ∈ [0..1] → product ∈ [0..0.5], no clamp needed
+        exp_influence = novelty * generativity * 0.5
 
         fp = temporal_mod.fp_recursive(
             novelty=novelty,
@@ -215,17 +239,17 @@ class M27_TemporalProjector:
 
         return {
             "module": "M27",
-            "fp_recursive": round(fp, 4),
-            "novelty": round(novelty, 4),
-            "generativity": round(generativity, 4),
-            "exp_influence": round(exp_influence, 4),
+            "fp_recursive": fp,
+            "novelty": novelty,
+            "generativity": generativity,
+            "exp_influence": exp_influence,
         }
 
 
 # ===================================================================
 # M28 — Vector-Attention Cartographer (5D + RAW + ENTROPY)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M28_AttentionCartographer:
     """Maps attention in 5D: direction/magnitude/consistency/resonance/shadow."""
     attention_sampling_rate: int = 100       # [1..1000 Hz]
@@ -242,40 +266,37 @@ class M28_AttentionCartographer:
         direction_norms_history: list[float] | None = None,
         field_strength: float = 0.5,
         bidirectional_ratio: float = 0.5,
+        alignments: Mapping[str, float] | None = None,
     ) -> dict[str, Any]:
-        node_ids = vector.nodes
-        weights = scav_mod.compute_weights(tsc_per_node)
-
-        # Direction
-        rd = scav_mod.raw_direction(graph, node_ids, weights)
-        direction = normalize(rd)
-
-        # Shadow
-        rs = scav_mod.raw_shadow(graph, node_ids, weights)
-        shadow = normalize(rs) if norm(rs) > EPS else [0.0] * 12
+        """
+        SCAV 5D for *vector*.  *alignments* overrides the identity_alignment
+        the shadow gate reads per node (see ``raw_direction_and_shadow``).
 
-        # Magnitude
-        magnitude = scav_mod.scav_magnitude(gbi, tsc_per_node)
+        Returned values are unrounded; round at the presentation boundary.
+        """
+        # Direction, shadow, magnitude, entropy and shadow_magnitude in one
+        # fused pass over the vector's nodes
+        sp = scav_mod.scav_compute_all(graph, vector.nodes, tsc_per_node, gbi, alignments)
+        rd, rs = sp.raw_direction, sp.raw_shadow
+        nd, ns = sp.direction_norm, sp.shadow_norm
+        direction = normalize(rd, nd)
+        shadow = normalize(rs, ns) if ns > EPS else ZERO12
+        magnitude, entropy, shadow_mag = sp.magnitude, sp.entropy, sp.shadow_magnitude
 
         # Consistency
-        hist = direction_norms_history or [norm(rd)]
+        hist = direction_norms_history or [nd]
         consistency_val = scav_mod.consistency_metric(hist)
 
         # Resonance
         resonance_val = scav_mod.resonance_metric(field_strength, bidirectional_ratio)
 
-        # Entropy
-        entropy = scav_mod.attention_entropy(weights)
-
-        # Shadow magnitude
-        shadow_mag = scav_mod.shadow_magnitude_metric(rd, rs)
-
         # SCAV health
         health = scav_mod.scav_health(consistency_val, resonance_val, entropy, shadow_mag)
 
         # Store on vector
         vector.direction_raw = rd
         vector.shadow_raw = rs
+        vector.shadow_magnitude = shadow_mag
         vector.scav_magnitude = magnitude
         vector.consistency = consistency_val
         vector.resonance_score = resonance_val
@@ -283,22 +304,22 @@ class M28_AttentionCartographer:
 
         return {
             "module": "M28",
-            "direction": [round(d, 4) for d in direction],
-            "direction_raw": [round(d, 4) for d in rd],
-            "shadow_raw": [round(d, 4) for d in rs],
-            "magnitude": round(magnitude, 4),
-            "consistency": round(consistency_val, 4),
-            "resonance": round(resonance_val, 4),
-            "shadow_magnitude": round(shadow_mag, 4),
-            "attention_entropy": round(entropy, 4),
-            "scav_health": round(health, 4),
+            "direction": direction,
+            "direction_raw": list(rd),
+            "shadow_raw": list(rs),
+            "magnitude": magnitude,
+            "consistency": consistency_val,
+            "resonance": resonance_val,
+            "shadow_magnitude": shadow_mag,
+            "attention_entropy": entropy,
+            "scav_health": health,
         }
 
 
 # ===================================================================
 # M29 — Paradox Holder (MU-LOGIC + GAP-AWARE)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M29_ParadoxHolder:
     """Holds paradoxes without forcing resolution (MU)."""
     paradox_tolerance: float = 0.1          # [0..0.3 of N]
@@ -331,15 +352,15 @@ class M29_ParadoxHolder:
             for v in vectors:
                 for nid in v.nodes:
                     n = graph.get_node(nid)
-                    if n and n.status not in (NodeStatus.ETHICALLY_BLOCKED, NodeStatus.MU):
+                    if n and n.status not in _HOLDER_SKIP:
                         # Only mark if genuinely conflicted
                         if n.uncertainty > 0.6 or n.identity_alignment == 0.0:
-                            n.status = NodeStatus.MU
+                            graph.set_node_status(nid, NodeStatus.MU)
                             mu_nodes.append(nid)
 
         # Mu density
         total = len(graph.nodes)
-        mu_count = sum(1 for n in graph.nodes.values() if n.status == NodeStatus.MU)
+        mu_count = len(graph.status_index[NodeStatus.MU])
         mu_density = mu_count / max(1, total)
 
         return {
@@ -348,14 +369,14 @@ class M29_ParadoxHolder:
             "alignment_trigger": alignment_trigger,
             "gap_trigger": gap_trigger,
             "mu_nodes_marked": mu_nodes,
-            "mu_density": round(mu_density, 4),
+            "mu_density": mu_density,
         }
 
 
 # ===================================================================
 # M30 — Ethical Gravity Filter (LOVE > LOGIC, EXECUTABLE)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class M30_EthicalGravityFilter:
     """Filters vectors through ethics and determines executability."""
     ethical_threshold_min: float = 0.4       # [0.4..1.0]
@@ -372,32 +393,29 @@ class M30_EthicalGravityFilter:
         Compute ethical_coefficient and executable for each vector.
         Returns aggregate metrics.
         """
-        eth_coeffs: list[float] = []
-        executables: list[bool] = []
-
-        for v in vectors:
-            # Ensure harm/alignment are computed
-            for nid in v.nodes:
-                n = graph.get_node(nid)
-                if n:
-                    n.harm_probability = ethics_mod.compute_harm_probability(n, graph)
-                    n.identity_alignment = ethics_mod.compute_identity_alignment(n)
-
-            ec = ethics_mod.ethical_coefficient(graph, v.nodes)
-            exe = ethics_mod.is_executable(graph, v.nodes, ec, self.ethical_threshold_min)
+        # Ensure harm/alignment are computed — once per distinct node, since
+        # candidate vectors overlap heavily and neither value depends on
+        # another node's harm/alignment.
+        for nid in dict.fromkeys(nid for v in vectors for nid in v.nodes):
+            n = graph.get_node(nid)
+            if n:
+                n.harm_probability = ethics_mod.compute_harm_probability(n, graph)
+                n.identity_alignment = ethics_mod.compute_identity_alignment(n)
 
+        eth_coeffs, executables = ethics_mod.evaluate_vectors(
+            graph, [v.nodes for v in vectors], self.ethical_threshold_min,
+        )
+        for v, ec, exe in zip(vectors, eth_coeffs, executables):
             v.ethical_coefficient = ec
             v.executable = exe
-            eth_coeffs.append(ec)
-            executables.append(exe)
 
         esc = ethics_mod.ethical_score_candidates(eth_coeffs)
         bf = ethics_mod.blocked_fraction(executables)
 
         return {
             "module": "M30",
-            "ethical_score_candidates": round(esc, 4),
-            "blocked_fraction": round(bf, 4),
-            "individual_ethics": [round(e, 4) for e in eth_coeffs],
+            "ethical_score_candidates": esc,
+            "blocked_fraction": bf,
+            "individual_ethics": eth_coeffs,
             "individual_executable": executables,
         }
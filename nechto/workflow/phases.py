@@ -44,8 +44,8 @@ from nechto.modules.level4 import (
     M28_AttentionCartographer, M29_ParadoxHolder,
     M30_EthicalGravityFilter,
 )
-from nechto.metrics import base, capital, scav as scav_mod, stereoscopic as stereo_mod
-from nechto.space.semantic_space import ideal_direction, normalize, norm, EPS
+from nechto.metrics import base, capital, stereoscopic as stereo_mod
+from nechto.space.semantic_space import ideal_direction_with_norm, norm, EPS
 from nechto.workflow.qmm_library import (
     QMM_ParadoxHolder, QMM_ParadoxCollapse, QMM_ShadowIntegration,
     QMM_FlowRestoration, QMM_EthicalOverride, QMM_EpistemicHonesty,
@@ -57,8 +57,17 @@ from nechto.reflexion.analyzer import ReflexionAnalyzer, ISCVPSelfProbeResult
 # Minimum candidate vectors to guarantee per spec v4.9
 MIN_CANDIDATES = 5
 
+# Phase 3.5 ethics gate flags
+GATE_ETHICAL_COLLAPSE = 1   # Ethical_score_candidates < 0.4
+GATE_ETHICAL_STALL = 2      # Blocked_fraction > 0.6
 
-@dataclass
+
+def _evaluate_gate_bits(esc: float, bf: float) -> int:
+    """Phase 3.5 ethics gate as a flag mask; 0 means both checks pass."""
+    return (GATE_ETHICAL_COLLAPSE if esc < 0.4 else 0) | (GATE_ETHICAL_STALL if bf > 0.6 else 0)
+
+
+@dataclass(slots=True)
 class WorkflowResult:
     """Result of running the 12-phase workflow."""
 
@@ -80,8 +89,45 @@ class WorkflowResult:
     affective_state: dict | None = None
     iscvp_probe: dict | None = None
 
+    def rounded_metrics(self, ndigits: int = 4) -> dict[str, float]:
+        """Metrics with float values rounded, as output and the PRRIP gate see them."""
+        return {
+            k: round(v, ndigits) if isinstance(v, float) else v
+            for k, v in self.metrics.items()
+        }
+
+
+@dataclass(slots=True)
+class CandidateBatch:
+    """Column view of CANDIDATE_SET scores, built once after TSC_extended."""
+
+    tsc_extended: list[float]
+    scav_magnitude: list[float]
+    executable: list[bool]
+
+    @classmethod
+    def from_vectors(cls, vectors: list[Vector]) -> CandidateBatch:
+        return cls(
+            tsc_extended=[v.tsc_extended for v in vectors],
+            scav_magnitude=[v.scav_magnitude for v in vectors],
+            executable=[v.executable for v in vectors],
+        )
+
+    @property
+    def n_active(self) -> int:
+        return sum(self.executable)
+
+    def best_executable(self) -> int | None:
+        """Index of the first executable max-TSC_extended candidate, if any."""
+        best_i: int | None = None
+        best = 0.0
+        for i, (score, exe) in enumerate(zip(self.tsc_extended, self.executable)):
+            if exe and (best_i is None or score > best):
+                best_i, best = i, score
+        return best_i
+
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowExecutor:
     """Executes the 12-phase NECHTO workflow."""
 
@@ -147,6 +193,8 @@ class WorkflowExecutor:
         ctx = context or {}
         result = WorkflowResult()
         result.params_snapshot = params.snapshot()
+        # Structural proxies (Φ/GBI/GNS) shared across modules this cycle
+        proxies = base.ProxyCache()
 
         # ===============================================================
         # PHASE 1 — Null-Void Scan (M01–M02)
@@ -183,14 +231,15 @@ class WorkflowExecutor:
         p3_seed = self.m11.initialize()
         p3_kernel = self.m12.bind(p3_field, p3_echo, p3_seed)
 
-        all_node_ids = list(graph.nodes.keys())
+        # Execute never adds or removes nodes, so the id tuple and count
+        # taken here stay valid for the rest of the cycle
+        all_node_ids = tuple(graph.nodes)
+        n_nodes = len(all_node_ids)
         n_all_edges = len(graph.edges)
 
         p3_probe = self.m09.probe(graph, all_node_ids)
         p3_ci = base.coherence_index(graph, all_node_ids, n_all_edges)
-        mu_density_global = sum(
-            1 for n in graph.nodes.values() if n.status == NodeStatus.MU
-        ) / max(1, len(graph.nodes))
+        mu_density_global = len(graph.status_index[NodeStatus.MU]) / max(1, n_nodes)
         p3_coherence = self.m13.check(p3_ci, mu_density_global)
         p3_grounding = self.m14.ground(graph, all_node_ids)
         p3_weave = self.m15.weave(graph, all_node_ids)
@@ -241,7 +290,7 @@ class WorkflowExecutor:
 
         # 1) Generate CANDIDATE_SET (v4.9: guarantee MIN_CANDIDATES)
         candidates = self.m24.generate(graph, seed_ids)
-        if len(candidates) < MIN_CANDIDATES and len(graph.nodes) >= MIN_CANDIDATES:
+        if len(candidates) < MIN_CANDIDATES and n_nodes >= MIN_CANDIDATES:
             # try generating without seed constraint
             candidates = self.m24.generate(graph, None)
         result.candidate_set_size = len(candidates)
@@ -252,86 +301,101 @@ class WorkflowExecutor:
             result.recovery_info = self.m26.recover("FAIL_VECTOR_DECOHERENCE")
             return result
 
-        # 2) Compute per-node and per-vector TSC_base
-        ideal_dir = ideal_direction(intent)
-        tsc_bases: list[float] = []
-        scav_mags: list[float] = []
-
-        for v in candidates:
-            node_ids = v.nodes
-            n_edges = len(v.edges)
-
-            # Base metrics
-            ti = base.temporal_integrity(graph, node_ids)
-            ci = base.coherence_index(graph, node_ids, n_edges)
-            ar = base.anchoring_ratio(graph, node_ids)
-            ri = base.resonance_index(graph, node_ids)
-            phi = base.phi_proxy(graph, node_ids)
-            gbi = base.gbi_proxy(graph, node_ids)
-
-            sc = capital.semantic_capital(ar, ci, ti, params.alpha, params.beta, ri, phi)
-
-            # Temporal
-            proj = self.m27.project(graph, v, params)
-            fp = proj["fp_recursive"]
-
-            tsc_b = capital.tsc_base(sc, params.gamma, params.delta, fp)
-            v.tsc_base = tsc_b
-            tsc_bases.append(tsc_b)
-
-            # Per-node TSC for SCAV weights
-            tsc_per_node = {}
-            for nid in node_ids:
-                # Simplified: each node gets fraction of vector TSC
-                tsc_per_node[nid] = tsc_b / max(1, len(node_ids))
-
-            # 3) SCAV 5D
-            cart = self.m28.cartograph(
-                graph, v, tsc_per_node, gbi,
-                field_strength=ctx.get("resonance_field", 0.5),
-                bidirectional_ratio=ctx.get("bidirectional_ratio", 0.5),
-            )
-            scav_mags.append(v.scav_magnitude)
-
-        # 4) Ethics → executable, Blocked_fraction
+        # 2) Ethics → executable, Blocked_fraction.  M30 reads only node
+        #    tags/status/markers, so it runs before the SCAV/temporal pass.
+        #    It also refreshes identity_alignment, which M28's shadow gate
+        #    reads; the gate keeps seeing the values from before the
+        #    refresh, as when M30 ran after SCAV.
+        pre_ethics_alignment = {
+            nid: n.identity_alignment
+            for nid in dict.fromkeys(nid for v in candidates for nid in v.nodes)
+            if (n := graph.get_node(nid)) is not None
+        }
         ethics_result = self.m30.filter(graph, candidates)
-        result.blocked_fraction = ethics_result["blocked_fraction"]
-
-        # 5) TSC_extended (non-executable → 0)
-        for v in candidates:
-            rd = v.direction_raw if v.direction_raw else [0.0] * 12
-            direction_normalized = normalize(rd)
-            v.tsc_extended = capital.tsc_extended(
-                tsc_b=v.tsc_base,
+
+        # On an ethics FAIL every per-candidate projection, SCAV and
+        # stereoscopy result would be discarded, so none of it runs.
+        # M30 returns raw scores; the gate compares them at 4 places.
+        esc = round(ethics_result["ethical_score_candidates"], 4)
+        bf = round(ethics_result["blocked_fraction"], 4)
+        result.blocked_fraction = bf
+        gate_bits = _evaluate_gate_bits(esc, bf)
+        mean_alignment = 0.0  # only measured when the ethics checks pass
+        alignments: list[float] = []
+        gaps: list[float] = []
+        gap_max = 0.0
+
+        if not gate_bits:
+            # 3) Compute per-node and per-vector TSC_base
+            ideal_dir, ideal_norm = ideal_direction_with_norm(intent)
+            unit_dirs: list[list[float] | None] = []
+
+            for v in candidates:
+                node_ids = v.nodes
+                n_edges = len(v.edges)
+
+                # Base metrics
+                ti, ar, _ = base.status_ratios(graph, node_ids)
+                ci = base.coherence_index(graph, node_ids, n_edges)
+                ri = base.resonance_index(graph, node_ids)
+                phi = proxies.get(base.phi_proxy, graph, node_ids)
+                gbi = proxies.get(base.gbi_proxy, graph, node_ids)
+
+                sc = capital.semantic_capital(ar, ci, ti, params.alpha, params.beta, ri, phi)
+
+                # Temporal
+                proj = self.m27.project(graph, v, params, cache=proxies)
+                fp = round(proj["fp_recursive"], 4)
+
+                tsc_b = capital.tsc_base(sc, params.gamma, params.delta, fp)
+                v.tsc_base = tsc_b
+
+                # Per-node TSC for SCAV weights
+                # Simplified: each node gets an equal fraction of vector TSC
+                tsc_per_node = dict.fromkeys(node_ids, tsc_b / max(1, len(node_ids)))
+
+                # 4) SCAV 5D; M28 already returns the unit direction
+                scav = self.m28.cartograph(
+                    graph, v, tsc_per_node, gbi,
+                    field_strength=ctx.get("resonance_field", 0.5),
+                    bidirectional_ratio=ctx.get("bidirectional_ratio", 0.5),
+                    alignments=pre_ethics_alignment,
+                )
+                unit_dirs.append(scav["direction"] if v.executable else None)
+
+            # 5) TSC_extended (non-executable → 0) in one batched call.
+            #    The cosine still takes |u| of each unit direction: it is
+            #    1 only to within an ulp, and the scores must not drift
+            tsc_ext = capital.tsc_extended_batch(
+                tsc_b=[v.tsc_base for v in candidates],
                 lam=params.lam,
-                consistency=v.consistency,
-                current_direction=direction_normalized,
+                consistency=[v.consistency for v in candidates],
+                directions=unit_dirs,
                 ideal_dir=ideal_dir,
-                ethical_coeff=v.ethical_coefficient,
-                executable=v.executable,
+                ideal_norm=ideal_norm,
+                ethical_coeff=[v.ethical_coefficient for v in candidates],
+                executable=[v.executable for v in candidates],
             )
+            for v, score in zip(candidates, tsc_ext):
+                v.tsc_extended = score
 
-        # 6) Stereoscopy
-        tsc_ext_scores = [v.tsc_extended for v in candidates]
-        scav_mag_scores = [v.scav_magnitude for v in candidates]
-        alignments, gaps, gap_max = stereo_mod.compute_stereoscopic_batch(
-            tsc_ext_scores, scav_mag_scores,
-        )
-        for i, v in enumerate(candidates):
-            v.stereoscopic_alignment = alignments[i] if i < len(alignments) else 0.0
-            v.stereoscopic_gap = gaps[i] if i < len(gaps) else 0.0
+            # 6) Stereoscopy
+            batch = CandidateBatch.from_vectors(candidates)
+            alignments, gaps, gap_max = stereo_mod.compute_stereoscopic_batch(
+                batch.tsc_extended, batch.scav_magnitude,
+            )
+            for i, v in enumerate(candidates):
+                v.stereoscopic_alignment = alignments[i] if i < len(alignments) else 0.0
+                v.stereoscopic_gap = gaps[i] if i < len(gaps) else 0.0
 
         # 7) Decision logic
-        esc = ethics_result["ethical_score_candidates"]
-        bf = ethics_result["blocked_fraction"]
-
-        if esc < 0.4:
+        if gate_bits & GATE_ETHICAL_COLLAPSE:
             result.gate_status = "FAIL"
             result.fail_code = "FAIL_ETHICAL_COLLAPSE"
             result.recovery_info = self.m26.recover("FAIL_ETHICAL_COLLAPSE")
             state.record_fail("FAIL_ETHICAL_COLLAPSE", "ethical_check", "blocked")
 
-        elif bf > 0.6:
+        elif gate_bits & GATE_ETHICAL_STALL:
             result.gate_status = "FAIL"
             result.fail_code = "FAIL_ETHICAL_STALL"
             result.recovery_info = self.m26.recover("FAIL_ETHICAL_STALL")
@@ -348,12 +412,11 @@ class WorkflowExecutor:
                 result.mu_nodes = paradox_result.get("mu_nodes_marked", [])
 
             # Select best from ACTIVE_SET
-            active_set = [v for v in candidates if v.executable]
-            result.active_set_size = len(active_set)
+            result.active_set_size = batch.n_active
+            best_i = batch.best_executable()
 
-            if active_set:
-                best = max(active_set, key=lambda v: v.tsc_extended)
-                result.chosen_vector = best
+            if best_i is not None:
+                result.chosen_vector = candidates[best_i]
                 result.gate_status = "PASS"  # Tentative — PRRIP gate confirms
             else:
                 result.gate_status = "FAIL"
@@ -367,7 +430,7 @@ class WorkflowExecutor:
             "blocked_fraction": result.blocked_fraction,
             "ethical_score": esc,
             "gap_max": gap_max,
-            "mean_alignment": mean_alignment if 'mean_alignment' in dir() else 0.0,
+            "mean_alignment": mean_alignment,
         })
 
         if result.gate_status == "FAIL":
@@ -392,7 +455,7 @@ class WorkflowExecutor:
         # ===============================================================
         flow_result = self.m20.modulate(
             graph, chosen.nodes, len(chosen.edges),
-            list(state.success_difficulties),
+            state.success_difficulties,
         )
 
         # v4.9: apply affective flow_presence_delta
@@ -406,17 +469,15 @@ class WorkflowExecutor:
         if flow_result["flow"] < 0.3:
             qmm_flow_result = self.qmm_flow.activate(
                 graph, [v for v in candidates if v.executable],
-                len(chosen.edges), list(state.success_difficulties),
+                len(chosen.edges), state.success_difficulties,
             )
             result.phase_log.append({"phase": "6_QMM_FLOW", **qmm_flow_result})
 
         # ===============================================================
         # PHASE 7 — Shadow Audit (M28 + QMM_SHADOW_INTEGRATION)
         # ===============================================================
-        shadow_mag = scav_mod.shadow_magnitude_metric(
-            chosen.direction_raw or [0.0] * 12,
-            chosen.shadow_raw or [0.0] * 12,
-        )
+        # Computed for every candidate by M28 in Phase 3.5
+        shadow_mag = chosen.shadow_magnitude
         if shadow_mag > 0.5 and chosen.scav_health < 0.5:
             shadow_result = self.qmm_shadow.activate(
                 graph, chosen, shadow_mag, chosen.scav_health,
@@ -473,25 +534,25 @@ class WorkflowExecutor:
         # ===============================================================
         telemetry = self.m17.measure(
             graph, chosen.nodes, len(chosen.edges),
-            list(state.success_difficulties),
+            state.success_difficulties,
+            cache=proxies,
         )
         result.metrics = telemetry
-        result.metrics["TSC_score"] = round(chosen.tsc_extended, 4)
-        result.metrics["SCAV_health"] = round(chosen.scav_health, 4)
-        result.metrics["Stereoscopic_alignment"] = round(chosen.stereoscopic_alignment, 4)
-        result.metrics["Stereoscopic_gap_max"] = round(
-            max(gaps) if gaps else 0.0, 4
-        )
-        result.metrics["Ethical_score_candidates"] = round(esc, 4)
-        result.metrics["Mu_density"] = round(
-            sum(1 for n in graph.nodes.values() if n.status == NodeStatus.MU) / max(1, len(graph.nodes)),
-            4,
-        )
-
+        # Raw floats here; output rounds them via WorkflowResult.rounded_metrics()
+        result.metrics["TSC_score"] = chosen.tsc_extended
+        result.metrics["SCAV_health"] = chosen.scav_health
+        result.metrics["Stereoscopic_alignment"] = chosen.stereoscopic_alignment
+        result.metrics["Stereoscopic_gap_max"] = gap_max
+        result.metrics["Ethical_score_candidates"] = esc
+        result.metrics["Mu_density"] = len(graph.status_index[NodeStatus.MU]) / max(1, n_nodes)
+
+        # The gate and the cycle record see the 4-digit values, so threshold
+        # decisions and state history do not depend on sub-output precision
+        gate_metrics = result.rounded_metrics()
         gate_result = self.gate.check(
             graph=graph,
             chosen_vector=chosen,
-            metrics=result.metrics,
+            metrics=gate_metrics,
             epistemic_claims=result.epistemic_claims,
         )
 
@@ -538,15 +599,15 @@ class WorkflowExecutor:
         # Record cycle
         state.record_cycle(
             alignment=chosen.stereoscopic_alignment,
-            gap_max=max(gaps) if gaps else 0.0,
-            mu_density=result.metrics.get("Mu_density", 0.0),
+            gap_max=gap_max,
+            mu_density=gate_metrics.get("Mu_density", 0.0),
             flow_val=flow_val,
             chosen_vector_id=chosen.id,
         )
 
         # Update adaptive params
         params.f_alpha(
-            [h for h in state.alignment_history],
+            list(state.alignment_history),
             state.current_cycle,
         )
         effect = flow_val
@@ -11,7 +11,7 @@ from typing import Any
 
 from nechto.core.atoms import Vector, NodeStatus
 from nechto.core.graph import SemanticGraph
-from nechto.core.epistemic import EpistemicClaim, Observability, Stance
+from nechto.core.epistemic import EpistemicClaim, Observability, Scope, Stance
 from nechto.core.parameters import AdaptiveParameters
 
 
@@ -118,6 +118,43 @@ class PRRIPGate:
 # Output contract formatters (PART 10.2 / 10.3)
 # ---------------------------------------------------------------------------
 
+# Constant blocks of the contracts are joined once at import; per call only
+# the value-bearing lines are rendered (f-strings, which compile to direct
+# formatting ops; str.format templates would be re-parsed on every call).
+_PASS_HEADER = "\n".join([
+    "@i@*осознан_в*@NECHTO@",
+    "",
+    "GATE_STATUS: PASS",
+    "VISION_MODE: REFLEXIVE_STEREOSCOPIC_EXECUTABLE",
+    "",
+    "SETS:",
+])
+
+_PASS_METRIC_KEYS = (
+    "TI", "CI", "AR", "SQ_proxy", "Phi_proxy", "TSC_score",
+    "SCAV_health", "Stereoscopic_alignment", "Stereoscopic_gap_max",
+    "FLOW", "Ethical_score_candidates", "Mu_density",
+)
+
+_TRACE_DIVIDER = "\n---\n\nTRACE:"
+
+# Enum member → lowercase name, instead of .name.lower() per claim field
+_CLAIM_LABELS: dict[Scope | Observability | Stance, str] = {
+    m: m.name.lower() for e in (Scope, Observability, Stance) for m in e
+}
+
+
+def _claim_lines(epistemic_claims: list[EpistemicClaim]) -> list[str]:
+    if not epistemic_claims:
+        return ["  * (none)"]
+    labels = _CLAIM_LABELS
+    return [
+        f"  * {c.topic} | {labels[c.scope]} | "
+        f"{labels[c.observability]} | {labels[c.stance]} | {c.reason}"
+        for c in epistemic_claims
+    ]
+
+
 def format_output_pass(
     metrics: dict[str, float],
     chosen_vector: Vector,
@@ -132,40 +169,20 @@ def format_output_pass(
     content: str = "",
 ) -> str:
     """Format the PASS output contract (PART 10.2)."""
+    get = metrics.get
     lines = [
-        "@i@*осознан_в*@NECHTO@",
-        "",
-        "GATE_STATUS: PASS",
-        "VISION_MODE: REFLEXIVE_STEREOSCOPIC_EXECUTABLE",
-        "",
-        "SETS:",
+        _PASS_HEADER,
         f"  CANDIDATE_SET: [{candidate_count}]",
         f"  ACTIVE_SET: [{active_count}]",
         f"  Blocked_fraction: [{blocked_frac:.4f}]",
         "",
         "METRICS:",
+        *[f"  {k}: [{get(k, 0.0):.4f}]" for k in _PASS_METRIC_KEYS],
+        "",
+        "EPISTEMIC_CLAIMS:",
+        *_claim_lines(epistemic_claims),
     ]
 
-    metric_keys = [
-        "TI", "CI", "AR", "SQ_proxy", "Phi_proxy", "TSC_score",
-        "SCAV_health", "Stereoscopic_alignment", "Stereoscopic_gap_max",
-        "FLOW", "Ethical_score_candidates", "Mu_density",
-    ]
-    for k in metric_keys:
-        v = metrics.get(k, 0.0)
-        lines.append(f"  {k}: [{v:.4f}]")
-
-    lines.append("")
-    lines.append("EPISTEMIC_CLAIMS:")
-    if epistemic_claims:
-        for c in epistemic_claims:
-            lines.append(
-                f"  * {c.topic} | {c.scope.name.lower()} | "
-                f"{c.observability.name.lower()} | {c.stance.name.lower()} | {c.reason}"
-            )
-    else:
-        lines.append("  * (none)")
-
     lines.append("")
     if recommendation:
         lines.append(f"RECOMMENDATION: {recommendation}")
@@ -176,10 +193,7 @@ def format_output_pass(
         lines.append("")
         lines.append(content)
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    lines.append("TRACE:")
+    lines.append(_TRACE_DIVIDER)
     for k, v in trace.items():
         if isinstance(v, list):
             for item in v:
@@ -247,14 +261,7 @@ def format_output_fail(
 
     lines.append("")
     lines.append("EPISTEMIC_CLAIMS:")
-    if epistemic_claims:
-        for c in epistemic_claims:
-            lines.append(
-                f"  * {c.topic} | {c.scope.name.lower()} | "
-                f"{c.observability.name.lower()} | {c.stance.name.lower()} | {c.reason}"
-            )
-    else:
-        lines.append("  * (none)")
+    lines.extend(_claim_lines(epistemic_claims))
 
     lines.append("")
     lines.append("NEXT_ONE_STEP:")
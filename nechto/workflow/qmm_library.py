@@ -6,7 +6,9 @@ Quantum-Meta-Module patterns for paradox, shadow, flow, ethics, epistemic honest
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 from nechto.core.atoms import (
@@ -15,7 +17,9 @@ from nechto.core.atoms import (
 )
 from nechto.core.graph import SemanticGraph
 from nechto.core.state import State
-from nechto.core.epistemic import EpistemicClaim, Observability, Scope, Stance
+from nechto.core.epistemic import (
+    EpistemicClaim, Observability, Scope, Stance, invalid_claim_indices,
+)
 from nechto.metrics.scav import shadow_magnitude_metric
 from nechto.metrics.flow import flow_metric
 
@@ -23,7 +27,7 @@ from nechto.metrics.flow import flow_metric
 # ===================================================================
 # QMM_PARADOX_HOLDER
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class QMM_ParadoxHolder:
     """
     Holds paradox without forcing resolution.
@@ -43,25 +47,29 @@ class QMM_ParadoxHolder:
         if not (alignment_sustained or gap_sustained):
             return {"activated": False}
 
+        # Conflicting nodes (each shared node visited once); with none to
+        # hold there is no paradox to articulate
+        candidate_nids = dict.fromkeys(nid for v in vectors for nid in v.nodes)
+        mu_marked: list[str] = []
+        for nid in candidate_nids:
+            n = graph.get_node(nid)
+            if n and n.status is not NodeStatus.ETHICALLY_BLOCKED and n.uncertainty > 0.5:
+                mu_marked.append(nid)
+        if not mu_marked:
+            return {"activated": False, "mu_marked": mu_marked}
+
         # 1) Articulate
-        tsc_winner = max(vectors, key=lambda v: v.tsc_extended) if vectors else None
-        scav_winner = max(vectors, key=lambda v: v.scav_magnitude) if vectors else None
+        tsc_winner = max(vectors, key=lambda v: v.tsc_extended)
+        scav_winner = max(vectors, key=lambda v: v.scav_magnitude)
 
         articulation = (
-            f"TSC→{tsc_winner.id if tsc_winner else '?'}, "
-            f"SCAV→{scav_winner.id if scav_winner else '?'}, "
+            f"TSC→{tsc_winner.id}, SCAV→{scav_winner.id}, "
             "paradox — MU is acceptable."
         )
 
         # 2) Mark conflicting nodes MU
-        mu_marked: list[str] = []
-        for v in vectors:
-            for nid in v.nodes:
-                n = graph.get_node(nid)
-                if n and n.status not in (NodeStatus.ETHICALLY_BLOCKED,):
-                    if n.uncertainty > 0.5:
-                        n.status = NodeStatus.MU
-                        mu_marked.append(nid)
+        for nid in mu_marked:
+            graph.set_node_status(nid, NodeStatus.MU)
 
         # 3) Propose third integrating vector?
         third_vector_hint = "Consider generating a third vector Z bridging the poles."
@@ -77,7 +85,7 @@ class QMM_ParadoxHolder:
 # ===================================================================
 # QMM_PARADOX_COLLAPSE
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class QMM_ParadoxCollapse:
     """
     Controlled reduction of Mu_density.
@@ -90,29 +98,29 @@ class QMM_ParadoxCollapse:
         graph: SemanticGraph,
         consent: bool = False,
     ) -> dict[str, Any]:
-        mu_nodes = [n for n in graph.nodes.values() if n.status == NodeStatus.MU]
-        mu_density = len(mu_nodes) / max(1, len(graph.nodes))
+        mu_ids = graph.status_index[NodeStatus.MU]
+        mu_density = len(mu_ids) / max(1, len(graph.nodes))
 
         if mu_density <= 0.3:
-            return {"activated": False, "mu_density": round(mu_density, 4)}
+            return {"activated": False, "mu_density": mu_density}
 
         collapsed: list[str] = []
         if consent:
-            # Collapse half of MU nodes (soft choice toward ANCHORED)
-            for i, n in enumerate(mu_nodes):
+            # Collapse half of MU nodes (soft choice toward ANCHORED),
+            # walked in graph insertion order
+            mu_nodes = [nid for nid in graph.nodes if nid in mu_ids]
+            for i, nid in enumerate(mu_nodes):
                 if i % 2 == 0:
-                    n.status = NodeStatus.ANCHORED
-                    collapsed.append(n.id)
+                    graph.set_node_status(nid, NodeStatus.ANCHORED)
+                    collapsed.append(nid)
 
-        new_mu_density = sum(
-            1 for n in graph.nodes.values() if n.status == NodeStatus.MU
-        ) / max(1, len(graph.nodes))
+        new_mu_density = len(graph.status_index[NodeStatus.MU]) / max(1, len(graph.nodes))
 
         return {
             "activated": True,
             "collapsed_nodes": collapsed,
-            "mu_density_before": round(mu_density, 4),
-            "mu_density_after": round(new_mu_density, 4),
+            "mu_density_before": mu_density,
+            "mu_density_after": new_mu_density,
             "consent_given": consent,
         }
 
@@ -120,7 +128,7 @@ class QMM_ParadoxCollapse:
 # ===================================================================
 # QMM_SHADOW_INTEGRATION
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class QMM_ShadowIntegration:
     """
     Integration of avoided meanings.
@@ -153,24 +161,24 @@ class QMM_ShadowIntegration:
 
         if consent:
             # Create BRIDGE edges between direction-aligned and shadow nodes
-            direction_nodes = [
-                nid for nid in vector.nodes
-                if (n := graph.get_node(nid)) and n.identity_alignment > 0
-            ]
-            for sn in shadow_nodes:
-                for dn in direction_nodes[:2]:  # limit bridges
-                    edge = Edge(from_id=dn, to_id=sn, type=EdgeType.BRIDGES, weight=0.5)
-                    graph.add_edge(edge)
-                    bridges_added.append((dn, sn))
-                s_node = graph.get_node(sn)
-                if s_node:
-                    s_node.avoided_marker = AvoidedMarker.RESPECTED_BOUNDARY
-        else:
-            # Respect boundary
-            for sn in shadow_nodes:
-                s_node = graph.get_node(sn)
-                if s_node:
-                    s_node.avoided_marker = AvoidedMarker.RESPECTED_BOUNDARY
+            # (limit bridges: stop scanning after the first two anchors)
+            direction_nodes = list(islice(
+                (nid for nid in vector.nodes
+                 if (n := graph.get_node(nid)) and n.identity_alignment > 0),
+                2,
+            ))
+            new_edges = graph.add_edges(
+                Edge(from_id=dn, to_id=sn, type=EdgeType.BRIDGES, weight=0.5)
+                for sn in shadow_nodes
+                for dn in direction_nodes
+            )
+            bridges_added = [(e.from_id, e.to_id) for e in new_edges]
+
+        # Shadow nodes are marked as a respected boundary either way
+        for sn in shadow_nodes:
+            s_node = graph.get_node(sn)
+            if s_node:
+                s_node.avoided_marker = AvoidedMarker.RESPECTED_BOUNDARY
 
         return {
             "activated": True,
@@ -184,7 +192,7 @@ class QMM_ShadowIntegration:
 # ===================================================================
 # QMM_FLOW_RESTORATION
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class QMM_FlowRestoration:
     """
     Restores flow state.
@@ -197,7 +205,7 @@ class QMM_FlowRestoration:
         graph: SemanticGraph,
         vectors: list[Vector],
         n_edges: int,
-        success_history: list[float] | None = None,
+        success_history: deque[float] | list[float] | None = None,
     ) -> dict[str, Any]:
         # Find best flow candidate
         best_flow = 0.0
@@ -211,7 +219,7 @@ class QMM_FlowRestoration:
 
         return {
             "activated": True,
-            "best_flow": round(best_flow, 4),
+            "best_flow": best_flow,
             "recommended_vector": best_v.id if best_v else None,
             "suggestion": "Switch to vector with better skill/challenge balance",
         }
@@ -220,7 +228,7 @@ class QMM_FlowRestoration:
 # ===================================================================
 # QMM_ETHICAL_OVERRIDE
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class QMM_EthicalOverride:
     """
     Ethical blocking of a strong vector.
@@ -242,7 +250,7 @@ class QMM_EthicalOverride:
         return {
             "activated": True,
             "blocked_vector": vector.id,
-            "ethical_coefficient": round(vector.ethical_coefficient, 4),
+            "ethical_coefficient": vector.ethical_coefficient,
             "reason": f"ethical_coefficient {vector.ethical_coefficient:.4f} < threshold {threshold_min}",
             "suggestion": "Reformulate within non-harm boundaries",
         }
@@ -251,7 +259,7 @@ class QMM_EthicalOverride:
 # ===================================================================
 # QMM_EPISTEMIC_HONESTY (v4.7+)
 # ===================================================================
-@dataclass
+@dataclass(slots=True)
 class QMM_EpistemicHonesty:
     """
     Epistemic honesty of assertions.
@@ -299,12 +307,12 @@ class QMM_EpistemicHonesty:
     def audit_claims(self, claims: list[EpistemicClaim]) -> dict[str, Any]:
         """Check all claims for epistemic violations."""
         violations: list[dict] = []
-        for c in claims:
-            if not c.validate():
-                violations.append({
-                    "topic": c.topic,
-                    "issue": f"stance={c.stance.name} not allowed for observability={c.observability.name}",
-                })
+        for i in invalid_claim_indices(claims):
+            c = claims[i]
+            violations.append({
+                "topic": c.topic,
+                "issue": f"stance={c.stance.name} not allowed for observability={c.observability.name}",
+            })
         return {
             "total_claims": len(claims),
             "violations": violations,
@@ -8,6 +8,7 @@ PRRIP gate, 12-phase workflow, and full engine integration.
 
 from __future__ import annotations
 
+import copy
 import math
 import pytest
 
@@ -20,23 +21,26 @@ from nechto.core.atoms import (
 from nechto.core.graph import SemanticGraph
 from nechto.core.state import State
 from nechto.core.parameters import AdaptiveParameters
-from nechto.core.epistemic import EpistemicClaim, Observability, Scope, Stance
+from nechto.core.epistemic import (
+    EpistemicClaim, Observability, Scope, Stance, invalid_claim_indices,
+)
 
 from nechto.space.semantic_space import (
-    normalize, norm, cosine_similarity, dot,
-    ideal_direction, IntentProfile, DIM,
+    normalize, norm, cosine_similarity, cosine_with_norm, dot, dot12, batch_cosine,
+    ideal_direction, ideal_direction_with_norm, IntentProfile, DIM,
 )
 
 from nechto.metrics.base import (
     temporal_integrity, coherence_index, anchoring_ratio,
     freeze_decomposition, resonance_index, sq_proxy, phi_proxy,
-    gbi_proxy, gns_proxy,
+    gbi_proxy, gns_proxy, ProxyCache, gns_and_phi_proxy, status_ratios,
 )
-from nechto.metrics.capital import semantic_capital, tsc_base, tsc_extended
+from nechto.metrics.capital import semantic_capital, tsc_base, tsc_extended, tsc_extended_batch
 from nechto.metrics.scav import (
-    compute_weights, raw_direction, raw_shadow, shadow_gate,
+    compute_weights, raw_direction, raw_shadow, raw_direction_and_shadow, shadow_gate,
     scav_magnitude, consistency_metric, resonance_metric,
     attention_entropy, shadow_magnitude_metric, scav_health,
+    scav_compute_all,
 )
 from nechto.metrics.stereoscopic import (
     stereoscopic_alignment, stereoscopic_gaps, stereoscopic_gap_max,
@@ -45,16 +49,18 @@ from nechto.metrics.stereoscopic import (
 from nechto.metrics.flow import flow_metric, difficulty, edge_density
 from nechto.metrics.ethics import (
     compute_harm_probability, compute_identity_alignment,
-    ethical_coefficient, is_executable,
-    ethical_score_candidates, blocked_fraction,
+    ethical_coefficient, is_executable, evaluate_vectors,
+    ethical_score_candidates, blocked_fraction, TAG_HARM_MAX,
 )
 from nechto.metrics.temporal import ged_proxy_norm, expected_influence_on_present, fp_recursive
 
+from nechto.modules.level4 import M24_VectorGenerator
 from nechto.workflow.qmm_library import (
     QMM_ParadoxHolder, QMM_ParadoxCollapse, QMM_ShadowIntegration,
     QMM_FlowRestoration, QMM_EthicalOverride, QMM_EpistemicHonesty,
 )
 from nechto.workflow.prrip import PRRIPGate, format_output_pass, format_output_fail
+from nechto.workflow.phases import CandidateBatch
 from nechto.core.fail_codes import FailCode, get_fail_description
 from nechto.engine import NechtoEngine
 
@@ -62,8 +68,25 @@ from nechto.engine import NechtoEngine
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Helpers
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_GRAPH_PROTOTYPES: dict[tuple[int, bool], SemanticGraph] = {}
+
+
 def _make_graph(n: int = 5, connect: bool = True) -> SemanticGraph:
-    """Create a small test graph with *n* anchored nodes."""
+    """Return a fresh copy of a small test graph with *n* anchored nodes.
+
+    Each (n, connect) graph is built once per module; tests get deep
+    copies of its atoms and edges so their mutations never leak.
+    """
+    proto = _GRAPH_PROTOTYPES.get((n, connect))
+    if proto is None:
+        proto = _GRAPH_PROTOTYPES[(n, connect)] = _build_graph(n, connect)
+    return SemanticGraph(
+        nodes={nid: copy.deepcopy(atom) for nid, atom in proto.nodes.items()},
+        edges=[copy.copy(e) for e in proto.edges],
+    )
+
+
+def _build_graph(n: int, connect: bool) -> SemanticGraph:
     g = SemanticGraph()
     atoms = []
     for i in range(n):
@@ -106,6 +129,13 @@ class TestSemanticAtom:
         assert a.status == NodeStatus.MU
 
 
+class TestVector:
+    def test_default_ids_unique(self):
+        a, b = Vector(), Vector()
+        assert a.id != b.id
+        assert len(a.id) == 12
+
+
 class TestGraph:
     def test_add_remove(self):
         g = SemanticGraph()
@@ -119,6 +149,71 @@ class TestGraph:
         sub = g.subgraph(["n0", "n1", "n2"])
         assert len(sub.nodes) == 3
 
+    def test_version_bumps_on_mutation(self):
+        g = SemanticGraph()
+        v0 = g.version
+        g.add_node(SemanticAtom(label="a", id="a1"))
+        g.add_edge(Edge(from_id="a1", to_id="a1"))
+        g.remove_node("a1")
+        assert g.version == v0 + 3
+
+    def test_out_edges_index_refresh(self):
+        g = _make_graph(3)
+        assert [e.to_id for e in g.out_edges()["n0"]] == ["n1"]
+        g.add_edge(Edge(from_id="n0", to_id="n2"))
+        assert [e.to_id for e in g.out_edges()["n0"]] == ["n1", "n2"]
+
+    def test_add_edges_single_bump(self):
+        g = _make_graph(3, connect=False)
+        v0 = g.version
+        added = g.add_edges(Edge(from_id="n0", to_id=t) for t in ("n1", "n2"))
+        assert len(added) == 2 and len(g.edges) == 2
+        assert g.version == v0 + 1
+        g.add_edges([])
+        assert g.version == v0 + 1
+
+    def test_induced_adjacency_keeps_internal_edges(self):
+        g = _make_graph(4)  # path n0–n3
+        adj = g.induced_adjacency(["n0", "n1", "n3"])
+        assert adj == {"n0": {"n1"}, "n1": {"n0"}, "n3": set()}
+
+    def test_copy_is_independent(self):
+        g = _make_graph(3)
+        c = g.copy()
+        c.set_node_status("n0", NodeStatus.MU)
+        c.add_edge(Edge(from_id="n2", to_id="n0"))
+        assert g.nodes["n0"].status == NodeStatus.ANCHORED
+        assert len(g.edges) == 2 and len(c.edges) == 3
+        assert g.status_index[NodeStatus.MU] == set()
+
+    def test_adjacency_tracks_mutations(self):
+        g = _make_graph(3, connect=False)
+        assert g.neighbors("n0") == []
+        g.add_edge(Edge(from_id="n0", to_id="n1"))
+        assert g.neighbors("n1") == ["n0"]
+        g.remove_node("n0")
+        assert g.neighbors("n1") == []
+
+    def test_status_index(self):
+        g = _make_graph(3)
+        assert g.status_index[NodeStatus.ANCHORED] == {"n0", "n1", "n2"}
+        g.set_node_status("n1", NodeStatus.MU)
+        assert g.nodes["n1"].status == NodeStatus.MU
+        assert g.status_index[NodeStatus.MU] == {"n1"}
+        g.remove_node("n1")
+        assert not g.status_index[NodeStatus.MU]
+        assert SemanticGraph(nodes=dict(g.nodes)).status_index[NodeStatus.ANCHORED] == {"n0", "n2"}
+
+    def test_status_index_sees_direct_and_shared_writes(self):
+        g = _make_graph(3)
+        sub = g.subgraph(["n0", "n1"])  # shares atoms with g
+        assert sub.status_index[NodeStatus.ANCHORED] == {"n0", "n1"}
+        g.nodes["n0"].status = NodeStatus.BLOCKING
+        assert g.status_index[NodeStatus.BLOCKING] == {"n0"}
+        g.set_node_status("n1", NodeStatus.MU)
+        assert sub.status_index[NodeStatus.MU] == {"n1"}
+        assert sub.status_index[NodeStatus.ANCHORED] == set()
+
     def test_neighbors(self):
         g = _make_graph(3)
         assert "n1" in g.neighbors("n0")
@@ -141,6 +236,13 @@ class TestState:
             s.alignment_history.append(0.1)
         assert s.sustained(s.alignment_history, "<", 0.3, 3)
 
+    def test_sustained_checks_only_last_k(self):
+        s = State()
+        s.flow_history.extend([0.1, 0.9, 0.6, 0.7, 0.5])
+        assert s.sustained(s.flow_history, ">=", 0.5, 4)
+        assert not s.sustained(s.flow_history, ">=", 0.5, 5)
+        assert not s.sustained(s.flow_history, "!=", 0.5, 1)
+
     def test_record_cycle(self):
         s = State()
         s.record_cycle(0.5, 1.0, 0.1, 0.6, "v1")
@@ -166,6 +268,27 @@ class TestAdaptiveParameters:
         p.f_lambda(1.0, cycle=1)
         assert p.lam == pytest.approx(0.85, abs=0.01)
 
+    def test_snapshot_cached_until_change(self):
+        p = AdaptiveParameters()
+        s1 = p.snapshot()
+        cached = p._snapshot_cache
+        assert p.snapshot() == s1
+        assert p._snapshot_cache is cached
+        p.f_retro(0.0, 0.0, cycle=3)
+        assert p.snapshot()["trace"]["beta_retro"] == 3
+        p.f_alpha([0.7], cycle=4)
+        assert p.snapshot()["alpha"] == 0.7
+
+    def test_snapshot_mutation_does_not_leak(self):
+        p = AdaptiveParameters()
+        s = p.snapshot()
+        s["alpha"] = -1
+        s["trace"]["alpha"] = 99
+        fresh = p.snapshot()
+        assert fresh is not s
+        assert fresh["alpha"] == 0.5
+        assert fresh["trace"]["alpha"] == 0
+
 
 class TestEpistemicClaim:
     def test_valid_observed(self):
@@ -184,6 +307,15 @@ class TestEpistemicClaim:
         c = EpistemicClaim(topic="consciousness", observability=Observability.UNTESTABLE, stance=Stance.MU)
         assert c.validate()
 
+    def test_invalid_indices_match_validate(self):
+        claims = [
+            EpistemicClaim(topic=f"{o.name}-{s.name}", observability=o, stance=s)
+            for o in Observability for s in Stance
+        ]
+        expected = [i for i, c in enumerate(claims) if not c.validate()]
+        assert invalid_claim_indices(claims) == expected
+        assert [claims[i].stance for i in expected] == [Stance.AFFIRMED, Stance.DENIED]
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 2. R^12 Space tests
@@ -197,6 +329,18 @@ class TestSemanticSpace:
         v = [1.0, 2.0, 3.0]
         assert cosine_similarity(v, v) == pytest.approx(1.0, abs=1e-6)
 
+    def test_batch_cosine_matches_pairwise(self):
+        ref = ideal_direction()
+        rows = [[float(i == j) for i in range(DIM)] for j in range(DIM)] + [[0.0] * DIM]
+        assert batch_cosine(rows, ref) == [cosine_similarity(r, ref) for r in rows]
+
+    def test_dot12_matches_generic(self):
+        from operator import mul
+        a = [0.1 * i - 0.4 for i in range(DIM)]
+        b = ideal_direction(IntentProfile.AUDIT)
+        assert dot12(a, b) == sum(map(mul, a, b)) == dot(a, b)
+        assert dot([1.0, 2.0], [3.0, 4.0]) == 11.0
+
     def test_ideal_direction_default(self):
         d = ideal_direction()
         assert len(d) == DIM
@@ -206,6 +350,14 @@ class TestSemanticSpace:
             d = ideal_direction(p)
             assert len(d) == DIM
 
+    def test_ideal_direction_norm_cached(self):
+        v = [0.3] * DIM
+        for p in IntentProfile:
+            d, n = ideal_direction_with_norm(p.name.lower())
+            assert d is ideal_direction(p)
+            assert n == norm(d)
+            assert cosine_with_norm(v, d, n) == pytest.approx(cosine_similarity(v, d))
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 3. Base metrics
@@ -224,6 +376,15 @@ class TestBaseMetrics:
         g = _make_graph(4)
         assert anchoring_ratio(g, list(g.nodes)) == 1.0
 
+    def test_status_ratios_match_individual(self):
+        g = _make_graph(5)
+        g.nodes["n0"].status = NodeStatus.FLOATING
+        g.nodes["n1"].status = NodeStatus.BLOCKING
+        ids = list(g.nodes) + ["missing"]
+        assert status_ratios(g, ids) == (
+            temporal_integrity(g, ids), anchoring_ratio(g, ids), freeze_decomposition(g, ids),
+        )
+
     def test_ci(self):
         g = _make_graph(3)  # 2 edges, 3 choose 2 = 3
         ci = coherence_index(g, list(g.nodes), 2)
@@ -237,6 +398,43 @@ class TestBaseMetrics:
         g = _make_graph(4, connect=False)
         assert phi_proxy(g, list(g.nodes)) < 1.0
 
+    def test_proxy_cache_invalidated_by_edge(self):
+        g = _make_graph(4, connect=False)
+        cache = ProxyCache()
+        ids = list(g.nodes)
+        assert cache.get(phi_proxy, g, ids) == 0.25
+        g.add_edge(Edge(from_id="n0", to_id="n1"))
+        assert cache.get(phi_proxy, g, ids) == 0.5
+
+    def test_shared_cache_sees_novelty_writes(self):
+        from nechto.modules.level3 import M17_TelemetryLens
+        g = _make_graph(3)
+        cache = ProxyCache()
+        ids = list(g.nodes)
+        lens = M17_TelemetryLens()
+        assert lens.measure(g, ids, len(g.edges), cache=cache)["GNS_proxy"] == 0.4
+        for n in g.nodes.values():
+            n.novelty = 0.9
+        assert lens.measure(g, ids, len(g.edges), cache=cache)["GNS_proxy"] == 0.9
+
+    def test_proxy_cache_keys_on_graph_token(self):
+        base_g = _make_graph(4, connect=False)
+        cache = ProxyCache()
+        ids = list(base_g.nodes)
+        for expected, edges in ((0.25, []), (0.5, [Edge(from_id="n0", to_id="n1")])):
+            # Fresh graphs share version 0 and node ids; only the token differs
+            g = SemanticGraph(nodes=dict(base_g.nodes), edges=edges)
+            assert g.version == 0
+            assert cache.get(phi_proxy, g, ids) == expected
+            del g
+        assert base_g.token != base_g.copy().token
+
+    def test_fused_gns_phi_matches(self):
+        for connect in (True, False):
+            g = _make_graph(5, connect=connect)
+            for ids in (list(g.nodes), ["n2"], []):
+                assert gns_and_phi_proxy(g, ids) == (gns_proxy(g, ids), phi_proxy(g, ids))
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 4. Capital metrics
@@ -267,6 +465,19 @@ class TestCapitalMetrics:
         )
         assert te > 0
 
+    def test_tsc_extended_batch_matches_scalar(self):
+        ideal = ideal_direction()
+        dirs = [[1.0] * 12, None, [float(i % 3) for i in range(12)]]
+        exe = [True, False, True]
+        got = tsc_extended_batch([0.5, 0.7, 0.3], 0.8, [0.5, 0.5, 0.9], dirs, ideal, [0.9, 0.4, 0.6], exe)
+        assert got[1] == 0.0
+        for i in (0, 2):
+            assert got[i] == tsc_extended(
+                tsc_b=[0.5, 0.7, 0.3][i], lam=0.8, consistency=[0.5, 0.5, 0.9][i],
+                current_direction=dirs[i], ideal_dir=ideal,
+                ethical_coeff=[0.9, 0.4, 0.6][i], executable=True,
+            )
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 5. SCAV metrics
@@ -280,12 +491,39 @@ class TestSCAVMetrics:
         e = attention_entropy(w)
         assert e == pytest.approx(1.0, abs=0.01)
 
+    def test_attention_entropy_matches_definition(self):
+        w = {"a": 0.5, "b": 0.3, "c": 0.2, "d": 0.0}
+        h = -sum(p * math.log(p) for p in (0.5, 0.3, 0.2))
+        assert attention_entropy(w) == pytest.approx(h / math.log(4))
+
     def test_shadow_magnitude_no_shadow(self):
         rd = [1.0, 0.0, 0.0]
         rs = [0.0, 0.0, 0.0]
         sm = shadow_magnitude_metric(rd, rs)
         assert sm == pytest.approx(0.0, abs=1e-6)
 
+    def test_fused_direction_shadow_matches(self):
+        g = _make_graph(4)
+        g.nodes["n1"].identity_alignment = -0.4
+        g.nodes["n3"].avoided_marker = AvoidedMarker.AVOIDED
+        ids = list(g.nodes)
+        w = compute_weights({nid: 0.1 * (i + 1) for i, nid in enumerate(ids)})
+        rd, rs = raw_direction_and_shadow(g, ids, w)
+        assert rd == raw_direction(g, ids, w)
+        assert rs == raw_shadow(g, ids, w)
+
+    def test_scav_compute_all_matches_individual(self):
+        g = _make_graph(4)
+        g.nodes["n2"].identity_alignment = -0.3
+        ids = list(g.nodes)
+        tsc = {nid: 0.2 * (i + 1) for i, nid in enumerate(ids)}
+        w = compute_weights(tsc)
+        sp = scav_compute_all(g, ids, tsc, 0.7)
+        assert (sp.raw_direction, sp.raw_shadow) == raw_direction_and_shadow(g, ids, w)
+        assert sp.magnitude == scav_magnitude(0.7, tsc)
+        assert sp.entropy == attention_entropy(w)
+        assert sp.shadow_magnitude == pytest.approx(shadow_magnitude_metric(sp.raw_direction, sp.raw_shadow))
+
     def test_shadow_gate(self):
         a = SemanticAtom(label="a", identity_alignment=-0.5)
         assert shadow_gate(a) == 1.0
@@ -312,6 +550,21 @@ class TestStereoscopic:
         assert len(aligns) == 3
         assert gmax >= 0.0
 
+    def test_batch_reversed_ranks(self):
+        aligns, gaps, gmax = compute_stereoscopic_batch([0.9, 0.5, 0.3], [0.2, 0.6, 0.8])
+        assert aligns == [0.0, 1.0, 0.0]
+        assert gmax == max(gaps)
+
+    def test_batch_empty(self):
+        assert compute_stereoscopic_batch([], []) == ([], [], 0.0)
+
+    def test_gaps_match_statistics_zscores(self):
+        from statistics import mean, stdev
+        tsc, scav = [0.9, 0.5, 0.3, 0.7], [0.2, 0.6, 0.8, 0.1]
+        z = lambda xs: [(x - mean(xs)) / stdev(xs) for x in xs]
+        ref = [abs(a - b) for a, b in zip(z(tsc), z(scav))]
+        assert stereoscopic_gaps(tsc, scav) == ref
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 7. FLOW
@@ -330,11 +583,39 @@ class TestFlow:
         ed = edge_density(4, 6)
         assert ed == 1.0
 
+    def test_difficulty_memoized(self):
+        difficulty.cache_clear()
+        first = difficulty(12, 7)
+        assert difficulty(12, 7) == first
+        assert difficulty.cache_info().hits == 1
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 8. Ethics
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 class TestEthics:
+    def test_harm_probability_tag_mask_matches_max(self):
+        from itertools import combinations
+        g = SemanticGraph()
+        for r in range(len(Tag) + 1):
+            for combo in combinations(Tag, r):
+                a = SemanticAtom(label="t", tags=list(combo))
+                expected = max((TAG_HARM_MAX[t] for t in combo), default=0.0)
+                assert compute_harm_probability(a, g) == expected
+
+    def test_evaluate_vectors_matches_definition(self):
+        g = _make_graph(5)
+        for n in g.nodes.values():
+            n.identity_alignment = 0.8
+        g.nodes["n2"].harm_probability = 0.3
+        g.nodes["n4"].status = NodeStatus.ETHICALLY_BLOCKED
+        lists = [["n0", "n1"], ["n2", "n3", "n4"], ["n1", "ghost"], []]
+        ecs, exes = evaluate_vectors(g, lists, 0.4)
+        # clamp(mean(identity_alignment) × (1 - max harm), 0.1, 1.0); ghost → -1.0 / 1.0
+        assert ecs == pytest.approx([0.8, 0.8 * 0.7, 0.1, 1.0])
+        assert exes == [True, False, False, True]
+        assert exes == [is_executable(g, ids, ec, 0.4) for ids, ec in zip(lists, ecs)]
+
     def test_harm_probability_safe(self):
         g = SemanticGraph()
         a = SemanticAtom(label="safe", id="s1", tags=[Tag.WITNESS])
@@ -368,6 +649,16 @@ class TestEthics:
         g = _make_graph(3)
         assert not is_executable(g, ["n0", "n1"], eth_coeff=0.2, threshold_min=0.4)
 
+    def test_evaluate_vectors_blocked_node(self):
+        g = _make_graph(3)
+        for n in g.nodes.values():
+            n.identity_alignment = compute_identity_alignment(n)
+        ids = ["n0", "n1", "missing"]
+        (ec,), (exe,) = evaluate_vectors(g, [ids], 0.4)
+        assert (ec, exe) == (ethical_coefficient(g, ids), is_executable(g, ids, ec, 0.4))
+        g.nodes["n1"].status = NodeStatus.ETHICALLY_BLOCKED
+        assert evaluate_vectors(g, [["n0", "n1"]], 0.0)[1] == [False]
+
     def test_blocked_fraction(self):
         bf = blocked_fraction([True, True, False, False, False])
         assert bf == 0.6
@@ -388,6 +679,13 @@ class TestTemporal:
         gn = ged_proxy_norm(g1, g2)
         assert 0.0 < gn <= 1.0
 
+    def test_ged_partial_overlap(self):
+        g1 = _make_graph(4)           # n0..n3, 3 edges
+        g2 = _make_graph(3)           # n0..n2, 2 shared edges
+        g2.add_node(SemanticAtom(label="x", id="x1"))
+        # node_sim = 3/5, edge_sim = 2/3
+        assert ged_proxy_norm(g1, g2) == pytest.approx(1.0 - 0.5 * (3 / 5 + 2 / 3))
+
     def test_fp_recursive(self):
         fp = fp_recursive(novelty=0.5, generativity=0.6, temporal_horizon=0.8, beta_retro=0.2, exp_influence=0.3)
         assert fp > 0
@@ -413,6 +711,28 @@ class TestQMM:
         r = qmm.activate(v, threshold_min=0.4)
         assert not r["activated"]
 
+    def test_paradox_holder_needs_uncertain_nodes(self):
+        g = _make_graph(3)
+        s = State()
+        for _ in range(3):
+            s.alignment_history.append(0.1)
+        v = Vector(id="v1", nodes=list(g.nodes))
+        assert QMM_ParadoxHolder().activate(g, [v], s)["activated"] is False
+        g.nodes["n1"].uncertainty = 0.9
+        r = QMM_ParadoxHolder().activate(g, [v], s)
+        assert r["activated"]
+        assert r["mu_marked"] == ["n1"]
+        assert g.nodes["n1"].status is NodeStatus.MU
+
+    def test_paradox_collapse_with_consent(self):
+        g = _make_graph(4)
+        for nid in ("n0", "n1", "n2"):
+            g.set_node_status(nid, NodeStatus.MU)
+        r = QMM_ParadoxCollapse().activate(g, consent=True)
+        assert r["activated"]
+        assert r["collapsed_nodes"] == ["n0", "n2"]
+        assert r["mu_density_after"] == 0.25
+
     def test_epistemic_honesty_untestable(self):
         qmm = QMM_EpistemicHonesty()
         c = qmm.create_claim(
@@ -434,6 +754,15 @@ class TestQMM:
         assert len(r["violations"]) == 1
 
 
+class TestLevel4Modules:
+    def test_m24_expansion_depth(self):
+        g = _make_graph(6)  # path n0–n5
+        gen = M24_VectorGenerator(n_vectors=1, branching=2)
+        v = gen.generate(g, seed_ids=["n0"])[0]
+        assert set(v.nodes) == {"n0", "n1", "n2"}
+        assert {(e.from_id, e.to_id) for e in v.edges} == {("n0", "n1"), ("n1", "n2")}
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 11. PRRIP Gate
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -469,6 +798,19 @@ class TestPRRIPGate:
         assert not result.passed
 
 
+class TestWorkflowPhases:
+    def test_candidate_batch_selection(self):
+        b = CandidateBatch(
+            tsc_extended=[0.9, 0.4, 0.7, 0.7],
+            scav_magnitude=[0.1] * 4,
+            executable=[False, True, True, True],
+        )
+        assert b.n_active == 3
+        assert b.best_executable() == 2
+        b.executable = [False] * 4
+        assert b.best_executable() is None
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 12. Fail codes
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -514,6 +856,25 @@ class TestNechtoEngine:
         assert result.chosen_vector is not None
         assert result.metrics.get("TI", 0) > 0
 
+    def test_shadow_gate_reads_alignment_before_ethics_refresh(self):
+        engine = self._build_engine(5)
+        engine.graph.nodes["c1"].identity_alignment = -0.5  # override; M30 recomputes it
+        result = engine.run("explain this concept", context={"intent": "explain"})
+        assert result.gate_status == "PASS"
+        assert engine.graph.nodes["c1"].identity_alignment > 0
+        assert any(result.chosen_vector.shadow_raw)
+
+    def test_rounded_metrics_feed_output_and_state(self):
+        engine = self._build_engine(5)
+        engine.graph.set_node_status("c4", NodeStatus.MU)
+        engine.graph.add_node(SemanticAtom(label="extra", id="x", tags=[Tag.WITNESS]))
+        result = engine.run("explain this concept", context={"intent": "explain"})
+        assert result.gate_status == "PASS"
+        assert result.metrics["Mu_density"] == 1 / 6
+        rounded = result.rounded_metrics()
+        assert rounded["TSC_score"] == round(result.metrics["TSC_score"], 4)
+        assert engine.state.mu_density_history[-1] == rounded["Mu_density"] == 0.1667
+
     def test_engine_run_output_format(self):
         engine = self._build_engine(5)
         result = engine.run("implement feature")
@@ -606,6 +967,16 @@ class TestOutputContracts:
 class TestEntitySelfReference:
     """Tests for Я ЕСМЬ (I AM) entity self-reference functionality."""
 
+    def test_i_am_results_are_independent(self) -> None:
+        """Constant layers are shared templates; callers get their own copies."""
+        engine = NechtoEngine()
+        first = engine.i_am()
+        first["affirmations"].append("mutated")
+        first["untestable"]["consciousness"] = "changed"
+        second = engine.i_am()
+        assert "mutated" not in second["affirmations"]
+        assert second["untestable"]["consciousness"] == "MU"
+
     def test_i_am_returns_structure(self) -> None:
         """Test that i_am() returns expected structure."""
         engine = NechtoEngine()